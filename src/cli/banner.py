@@ -1,5 +1,12 @@
 """ASCII art banner for the CLI."""
 
+import os
+import sys
+
+from cli.colors import c
+
+_CLEAR_SEQUENCE = "\x1b[H\x1b[2J\x1b[3J"
+
 BANNER = """
 ╔══════════════════════════════════════════════════════════════════════════╗
 ║                                                                          ║
@@ -34,18 +41,32 @@ WARNING = """
 """
 
 
+# Colorized once at import; each print is then a single write
+_BANNER_TEXT = c("96", BANNER) + "\n"  # Cyan color
+_WARNING_TEXT = c("93", WARNING) + "\n"  # Yellow color
+
+
 def print_banner():
     """Print the ASCII art banner."""
-    print("\033[96m" + BANNER + "\033[0m")  # Cyan color
+    sys.stdout.write(_BANNER_TEXT)
+    sys.stdout.flush()
 
 
 def print_warning():
     """Print the legal warning."""
-    print("\033[93m" + WARNING + "\033[0m")  # Yellow color
+    sys.stdout.write(_WARNING_TEXT)
+    sys.stdout.flush()
 
 
 def clear_screen():
     """Clear the terminal screen."""
-    import os
-    os.system('clear' if os.name == 'posix' else 'cls')
+    if not sys.stdout.isatty():
+        return  # Nothing to clear when output is piped or redirected
+    if os.name == 'nt':
+        # Legacy Windows consoles may not honour VT escape sequences
+        os.system('cls')
+        return
+    # Home cursor, clear screen and scrollback in a single write (no fork/exec)
+    sys.stdout.write(_CLEAR_SEQUENCE)
+    sys.stdout.flush()
 
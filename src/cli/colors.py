@@ -0,0 +1,23 @@
+"""Terminal color helpers for the CLI."""
+import os
+import sys
+
+# Decided once at import: colors only when writing to a terminal and NO_COLOR is unset
+COLOR_ENABLED = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+
+def c(code: str, text: str) -> str:
+    """
+    Wrap text in an ANSI color escape when colors are enabled.
+
+    Args:
+        code: ANSI SGR code (e.g. "91" for red)
+        text: Text to colorize
+
+    Returns:
+        Colorized text, or the plain text when colors are disabled
+    """
+    if COLOR_ENABLED:
+        return f"\033[{code}m{text}\033[0m"
+    return text
+
@@ -1,37 +1,255 @@
 """Interactive CLI menu for pentesting utilities."""
 
+import argparse
 import sys
 import os
+import re
 import subprocess
+import threading
+from collections.abc import Sized
+from contextlib import contextmanager
+from itertools import chain
 from pathlib import Path
-from typing import Optional, List
-
-# Add src directory to path if running from subdirectory
-src_dir = Path(__file__).parent.parent
-if str(src_dir) not in sys.path:
-    sys.path.insert(0, str(src_dir))
-
-# Load environment variables
-try:
-    from dotenv import load_dotenv
-    # Load .env from project root
-    project_root = Path(__file__).parent.parent.parent
-    env_path = project_root / ".env"
-    load_dotenv(dotenv_path=env_path)
-except ImportError:
-    pass  # dotenv not installed, will use system environment variables
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+# Add src directory to path only when not already importable (e.g. run as a script)
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if "cli" not in sys.modules and _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+# Service modules are imported lazily inside each tool_* method so that
+# requests/BeautifulSoup are only loaded once the user selects a tool.
 from cli.banner import print_banner, print_warning, clear_screen
-from services.ping import ping_url
-from services.clone import clone_website
-from services.d2 import make_requests_until_blocked
-from services.attempt_login import attempt_credential_combinations
+from cli.colors import c
 from utils.logger import setup_logging, get_logger
-from utils.config import get_output_dir, get_clone_output_dir
+from utils.config import get_output_dir, get_clone_output_dir  # also loads .env once
+from utils.http import URL_SCHEMES, parse_url
 
 # Set up logging
 logger = setup_logging('penweb')
 
+# Static screens are built once at import time and emitted with a single write
+_SEPARATOR = "=" * 78
+
+_MAIN_MENU = (
+    "\n" + _SEPARATOR + "\n"
+    "                          MAIN MENU - Select a Tool\n"
+    + _SEPARATOR + "\n\n"
+    "  " + c("96", "[1]") + " 🛰️ GPS (DEFENSIVE)     - Device location tracker (multi-provider)\n"
+    "  " + c("96", "[2]") + " 🔐 VPN (DEFENSIVE)     - Multi-provider VPN manager\n"
+    "  " + c("96", "[3]") + " 📧 Email               - Temporary email address manager\n"
+    "  " + c("92", "[4]") + " 🌐 Ping                - Test URL availability and response time\n"
+    "  " + c("92", "[5]") + " 📋 Clone               - Download website HTML, CSS, and JS files\n"
+    "  " + c("91", "[6]") + " 💥 DDoS (OFFENSIVE)    - Test rate limiting with repeated requests\n"
+    "  " + c("91", "[7]") + " 🔐 Login (OFFENSIVE)   - Test login security with credentials\n"
+    "\n"
+    "  " + c("93", "[0]") + " 🚪 Exit                - Quit the application\n"
+    "\n"
+    + _SEPARATOR + "\n"
+)
+
+
+def _header(title: str) -> str:
+    """Build a tool screen header framed by separators."""
+    return "\n" + _SEPARATOR + "\n" + title + "\n" + _SEPARATOR + "\n"
+
+
+_GPS_HEADER = _header("                     🛰️   CLI - Device Location Tracker")
+_VPN_HEADER = _header("                      🔐 VPN CLI - Multi-Provider VPN Manager")
+_EMAIL_HEADER = _header("                    📧 Email CLI - Temporary Email Manager")
+_PING_HEADER = _header("                          🌐 PING URL - Test Availability")
+_CLONE_HEADER = _header("                      📋 CLONE WEBSITE - Download Resources")
+_DDOS_HEADER = _header("                  💥 DDOS TEST - Rate Limiting Analysis")
+_LOGIN_HEADER = _header("               🔐 LOGIN TEST - Credential Combination Testing")
+_RESULTS_HEADER = _header("                               RESULTS")
+
+# Submodule CLIs: key -> (display name, launcher script, screen header)
+_MODULES_DIR = Path(_SRC_DIR).parent / "modules"
+_SUBMODULE_TOOLS = {
+    "gps": ("GPS CLI", _MODULES_DIR / "gps-cli" / "gps", _GPS_HEADER),
+    "vpn": ("VPN CLI", _MODULES_DIR / "vpn-cli" / "vpn", _VPN_HEADER),
+    "email": ("Email CLI", _MODULES_DIR / "email-cli" / "email", _EMAIL_HEADER),
+}
+
+# Launcher scripts already confirmed to exist (missing ones are re-checked
+# each time so initializing the submodules does not require a restart)
+_found_scripts: Set[Path] = set()
+
+_EXIT_BANNER = (
+    "\n" + c("92", _SEPARATOR) + "\n"
+    + c("92", "                    Thank you for using PenWeb!") + "\n"
+    + c("92", "                      🛡️🔐 Stay safe. Stay legal.") + "\n"
+    + c("92", _SEPARATOR) + "\n\n"
+)
+
+
+_YES = frozenset(("y", "yes", "yeah", "yep"))
+
+# Exceptions that mean the user closed or interrupted a prompt
+_INPUT_CANCELLED = (EOFError, KeyboardInterrupt)
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def _parse_list(value: str) -> List[str]:
+    """Parse a comma-separated value into a list of non-empty items."""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def _iter_file(path: str) -> Iterator[str]:
+    """Lazily yield non-empty, stripped lines from a wordlist file."""
+    with open(path, encoding='utf-8', errors='replace') as handle:
+        for line in handle:
+            line = line.strip()
+            if line:
+                yield line
+
+
+def _wordlist_path(value: str) -> Optional[str]:
+    """Return the file path for an '@path' wordlist value, or None for inline values."""
+    if not value.startswith('@'):
+        return None
+    path = os.path.expanduser(value[1:].strip())
+    if not os.path.isfile(path):
+        print(c("91", f"✗ Error: Wordlist not found: {path}"))
+        return ''
+    return path
+
+
+def _parse_emails(value: str) -> Iterable[str]:
+    """
+    Parse comma-separated emails, lowercased and de-duplicated, dropping invalid ones.
+    
+    A value of '@path' streams emails from a wordlist file, one per line, without
+    loading the whole file into memory. Streamed emails are not de-duplicated and
+    invalid lines are skipped silently; a wordlist with no valid email gives [].
+    """
+    path = _wordlist_path(value)
+    if path is not None:
+        if not path:
+            return []
+        streamed = (email for email in map(str.lower, _iter_file(path)) if _EMAIL_RE.match(email))
+        # Peek so an empty wordlist is falsy like an empty inline list
+        first = next(streamed, None)
+        return [] if first is None else chain((first,), streamed)
+    
+    emails = list(dict.fromkeys(email.lower() for email in _parse_list(value)))
+    invalid = [email for email in emails if not _EMAIL_RE.match(email)]
+    if invalid:
+        print(c("93", f"⚠️  Skipping invalid email(s): {', '.join(invalid)}"))
+        emails = [email for email in emails if _EMAIL_RE.match(email)]
+    return emails
+
+
+def _parse_keywords(value: str) -> List[str]:
+    """Parse comma-separated keywords (or an '@path' wordlist), de-duplicated in input order."""
+    path = _wordlist_path(value)
+    if path is not None:
+        return list(dict.fromkeys(_iter_file(path))) if path else []
+    return list(dict.fromkeys(_parse_list(value)))
+
+
+# Lower bounds shared by the step-by-step prompts and the one-shot form
+_MIN_DELAY = 0.0
+_MIN_MAX_ATTEMPTS = 1
+
+
+def _parse_number(
+    raw: str,
+    typ: Callable[[str], Any],
+    default: Any,
+    minimum: Optional[float] = 0
+) -> Any:
+    """
+    Parse a numeric prompt answer, falling back to the default for this field only.
+    
+    Args:
+        raw: Raw user input
+        typ: Numeric type to parse (int or float)
+        default: Value used when the input is empty or invalid
+        minimum: Smallest accepted value (None = no lower bound)
+        
+    Returns:
+        Parsed number or the default
+    """
+    raw = raw.strip()
+    if not raw:
+        return default
+    try:
+        value = typ(raw)
+    except ValueError:
+        value = None
+    if value is None or (minimum is not None and not value >= minimum):  # also rejects NaN
+        shown = 'unlimited' if default is None else default
+        print(c("91", f"✗ '{raw}' is not valid here - using {shown}"))
+        return default
+    return value
+
+
+def _strict_number(
+    typ: Callable[[str], Any],
+    minimum: float,
+    optional: bool = False
+) -> Callable[[str], Any]:
+    """
+    Build a one-shot form parser with the same bounds as _parse_number.
+    
+    Unlike _parse_number there is no per-field default: invalid or out-of-range
+    values raise ValueError, which sends the form back to step-by-step prompts.
+    
+    Args:
+        typ: Numeric type to parse (int or float)
+        minimum: Smallest accepted value
+        optional: Whether an empty value is accepted (parsed as None)
+        
+    Returns:
+        Parser for one form value
+    """
+    def parse(raw: str) -> Any:
+        if optional and not raw:
+            return None
+        value = typ(raw)
+        if not value >= minimum:  # also rejects NaN
+            raise ValueError(f"'{raw}' is below the minimum of {minimum}")
+        return value
+    return parse
+
+
+# Fields accepted by the login tool's one-shot key=value form
+_LOGIN_FORM: List[Tuple[str, Callable[[str], Any]]] = [
+    ("url", str),
+    ("emails", _parse_emails),
+    ("keywords", _parse_keywords),
+    ("delay", _strict_number(float, _MIN_DELAY)),
+    ("max_attempts", _strict_number(int, _MIN_MAX_ATTEMPTS, optional=True)),
+]
+
+
+def _write(text: str) -> None:
+    """Write a prebuilt block of text to stdout in one call."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def _prompt(text: str = "") -> str:
+    """
+    Read one line of input after showing a prompt.
+    
+    Interactive terminals keep input() for readline line editing; piped stdin
+    (scripted runs, tests) is read directly with sys.stdin.readline().
+    
+    Raises:
+        EOFError: At end of input, like input()
+    """
+    if sys.stdin.isatty():
+        return input(text)
+    sys.stdout.write(text)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\r\n")
+
 
 class PentestMenu:
     """Interactive menu for pentesting utilities."""
@@ -39,418 +257,504 @@ class PentestMenu:
     def __init__(self):
         """Initialize the menu."""
         self.running = True
+        self._default_clone_dir = get_clone_output_dir()
+        self._session = None
+        # Menu choice -> bound handler, resolved once instead of per iteration
+        self._dispatch = {
+            "1": self.tool_gps,
+            "2": self.tool_vpn,
+            "3": self.tool_email,
+            "4": self.tool_ping,
+            "5": self.tool_clone,
+            "6": self.tool_ddos,
+            "7": self.tool_login,
+            "0": self._exit,
+        }
+
+    @property
+    def session(self):
+        """Shared HTTP session for the network tools, created on first use."""
+        if self._session is None:
+            from utils.http import create_session
+            self._session = create_session()
+        return self._session
 
     def display_main_menu(self):
         """Display the main menu options."""
-        print("\n" + "=" * 78)
-        print("                          MAIN MENU - Select a Tool")
-        print("=" * 78 + "\n")
-        print("  \033[96m[1]\033[0m 🛰️ GPS (DEFENSIVE)     - Device location tracker (multi-provider)")
-        print("  \033[96m[2]\033[0m 🔐 VPN (DEFENSIVE)     - Multi-provider VPN manager")
-        print("  \033[96m[3]\033[0m 📧 Email               - Temporary email address manager")
-        print("  \033[92m[4]\033[0m 🌐 Ping                - Test URL availability and response time")
-        print("  \033[92m[5]\033[0m 📋 Clone               - Download website HTML, CSS, and JS files")
-        print("  \033[91m[6]\033[0m 💥 DDoS (OFFENSIVE)    - Test rate limiting with repeated requests")
-        print("  \033[91m[7]\033[0m 🔐 Login (OFFENSIVE)   - Test login security with credentials")
-        print()
-        print("  \033[93m[0]\033[0m 🚪 Exit                - Quit the application")
-        print()
-        print("=" * 78)
+        _write(_MAIN_MENU)
 
     def get_choice(self) -> str:
         """Get user's menu choice."""
         try:
-            choice = input("\n\033[96mSelect an option [0-7]: \033[0m").strip()
+            choice = _prompt("\n" + c("96", "Select an option [0-7]: ")).strip()
             return choice
-        except (EOFError, KeyboardInterrupt):
-            print("\n\n\033[93m⚠️  Interrupted by user\033[0m")
+        except _INPUT_CANCELLED:
+            print("\n\n" + c("93", "⚠️  Interrupted by user"))
             return "0"
 
     def get_url_input(self, prompt: str = "Enter target URL") -> Optional[str]:
         """Get URL input from user."""
         try:
-            url = input(f"\n\033[96m{prompt}: \033[0m").strip()
+            url = _prompt("\n" + c("96", f"{prompt}: ")).strip()
             
             if not url:
-                print("\033[91m✗ Error: URL cannot be empty\033[0m")
+                print(c("91", "✗ Error: URL cannot be empty"))
                 return None
             
-            if not url.startswith(('http://', 'https://')):
-                print("\033[93m⚠️  Warning: URL should start with http:// or https://\033[0m")
-                add_https = input("\033[96mAdd https:// automatically? (Y/n): \033[0m").strip().lower()
+            if not url.startswith(URL_SCHEMES):
+                print(c("93", "⚠️  Warning: URL should start with http:// or https://"))
+                add_https = _prompt(c("96", "Add https:// automatically? (Y/n): ")).strip().lower()
                 if add_https != 'n':
                     url = f"https://{url}"
             
+            if not parse_url(url).netloc:
+                print(c("91", "✗ Error: URL must include a host name"))
+                return None
+            
             return url
-        except (EOFError, KeyboardInterrupt):
-            print("\n\033[93m⚠️  Input cancelled\033[0m")
+        except _INPUT_CANCELLED:
+            print("\n" + c("93", "⚠️  Input cancelled"))
             return None
 
     def get_yes_no(self, prompt: str) -> bool:
         """Get yes/no confirmation from user."""
         try:
-            response = input(f"\n\033[96m{prompt} (y/N): \033[0m").strip().lower()
-            return response in ['y', 'yes']
-        except (EOFError, KeyboardInterrupt):
+            response = _prompt("\n" + c("96", f"{prompt} (y/N): ")).strip().lower()
+            return response in _YES
+        except _INPUT_CANCELLED:
             return False
 
+    def _bulk_input(self, schema: List[Tuple[str, Callable[[str], Any]]]) -> Optional[Dict[str, Any]]:
+        """
+        Collect several fields at once from key=value lines.
+
+        Args:
+            schema: List of (field name, parser) pairs
+
+        Returns:
+            Parsed fields, an empty dict to fall back to step-by-step prompts,
+            or None if input was cancelled
+        """
+        parsers = dict(schema)
+        print("\n" + c("96", "Paste settings as key=value lines, then a blank line to finish."))
+        print(c("90", f"Fields: {', '.join(parsers)} (press Enter for step-by-step prompts)"))
+        
+        values: Dict[str, Any] = {}
+        try:
+            while True:
+                line = _prompt().strip()
+                if not line:
+                    break
+                key, sep, raw = line.partition('=')
+                key = key.strip().lower()
+                if not sep or key not in parsers:
+                    print(c("91", f"✗ Unknown setting '{line}' - switching to step-by-step prompts"))
+                    return {}
+                values[key] = parsers[key](raw.strip())
+        except ValueError:
+            print(c("91", "✗ Invalid value - switching to step-by-step prompts"))
+            return {}
+        except _INPUT_CANCELLED:
+            print("\n" + c("93", "⚠️  Input cancelled"))
+            return None
+        
+        return values
+
     def pause(self):
         """Pause and wait for user input."""
         try:
-            input("\n\033[90mPress Enter to continue...\033[0m")
-        except (EOFError, KeyboardInterrupt):
+            _prompt("\n" + c("90", "Press Enter to continue..."))
+        except _INPUT_CANCELLED:
             pass
 
-    # ==================== TOOL 1: GPS CLI ====================
-    def tool_gps(self):
-        """Execute the GPS CLI tool from git submodule."""
-        clear_screen()
-        print("\n" + "=" * 78)
-        print("                     🛰️   CLI - Device Location Tracker")
-        print("=" * 78)
-        print("\n\033[96mLaunching GPS CLI...\033[0m\n")
+    @contextmanager
+    def _tool_frame(self, header: str) -> Iterator[None]:
+        """
+        Frame a tool screen: clear it, write the prebuilt header, pause when done.
         
-        # Get path to GPS CLI script
-        project_root = Path(__file__).parent.parent.parent
-        gps_script = project_root / "modules" / "gps-cli" / "gps"
+        Returning early from the body still pauses; an exception propagates
+        without pausing.
         
-        if not gps_script.exists():
-            print(f"\n\033[91m✗ Error: GPS CLI not found at {gps_script}\033[0m")
-            print("\033[93m⚠️  Make sure git submodules are initialized:\033[0m")
-            print("    git submodule update --init --recursive\n")
-            self.pause()
-            return
+        Args:
+            header: Prebuilt screen header (one of the module-level *_HEADER strings)
+        """
+        clear_screen()
+        _write(header)
+        yield
+        self.pause()
+
+    def _run_blocking(self, fn: Callable[..., Any], **kwargs: Any) -> Any:
+        """
+        Run a long service call on a worker thread so Ctrl+C is handled at once.
         
-        logger.info("Tool: GPS CLI launched")
+        The main thread only waits on the worker. Ctrl+C sets the stop event the
+        service checks between requests; a second Ctrl+C stops waiting for it.
         
-        try:
-            # Execute GPS CLI in interactive mode
-            result = subprocess.run(
-                [str(gps_script)],
-                cwd=str(gps_script.parent),
-                check=False
-            )
+        Args:
+            fn: Service function accepting a stop_event keyword argument
+            **kwargs: Arguments forwarded to fn
             
-            if result.returncode == 0:
-                logger.info("GPS CLI exited successfully")
-            else:
-                logger.warning(f"GPS CLI exited with code {result.returncode}")
-                
+        Returns:
+            The value returned by fn (None if the worker was abandoned, in which
+            case the shared session is replaced)
+        """
+        stop_event = threading.Event()
+        # Signalled by the worker itself; Thread.join() interrupted by Ctrl+C can
+        # leave is_alive() reporting False while the thread is still running
+        done = threading.Event()
+        outcome: Dict[str, Any] = {}
+        
+        def target():
+            try:
+                outcome['result'] = fn(stop_event=stop_event, **kwargs)
+            except Exception as e:
+                outcome['error'] = e
+            finally:
+                done.set()
+        
+        threading.Thread(target=target, name=fn.__name__, daemon=True).start()
+        try:
+            while not done.wait(0.1):
+                pass
         except KeyboardInterrupt:
-            print("\n\033[93m⚠️  GPS CLI interrupted\033[0m")
-            logger.info("GPS CLI interrupted by user")
-        except Exception as e:
-            logger.error(f"GPS CLI error: {str(e)}")
-            print(f"\n\033[91m✗ Error: {str(e)}\033[0m")
+            stop_event.set()
+            print("\n" + c("93", "⚠️  Stopping after the current request (Ctrl+C again to abandon it)..."))
+            try:
+                while not done.wait(0.1):
+                    pass
+            except KeyboardInterrupt:
+                print(c("93", "⚠️  Abandoned the running request"))
+                # The worker may still be using the shared session (sessions are not
+                # thread-safe), so later tools get a fresh one from the property
+                self._session = None
+                return None
         
-        self.pause()
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('result')
+
+    # ==================== TOOLS 1-3: SUBMODULE CLIS ====================
+    def tool_gps(self):
+        """Execute the GPS CLI tool from git submodule."""
+        self._run_submodule("gps")
 
-    # ==================== TOOL 2: VPN CLI ====================
     def tool_vpn(self):
         """Execute the VPN CLI tool from git submodule."""
-        clear_screen()
-        print("\n" + "=" * 78)
-        print("                      🔐 VPN CLI - Multi-Provider VPN Manager")
-        print("=" * 78)
-        print("\n\033[96mLaunching VPN CLI...\033[0m\n")
-        
-        # Get path to VPN CLI script
-        project_root = Path(__file__).parent.parent.parent
-        vpn_script = project_root / "modules" / "vpn-cli" / "vpn"
-        
-        if not vpn_script.exists():
-            print(f"\n\033[91m✗ Error: VPN CLI not found at {vpn_script}\033[0m")
-            print("\033[93m⚠️  Make sure git submodules are initialized:\033[0m")
-            print("    git submodule update --init --recursive\n")
-            self.pause()
-            return
-        
-        logger.info("Tool: VPN CLI launched")
-        
-        try:
-            # Execute VPN CLI in interactive mode
-            result = subprocess.run(
-                [str(vpn_script)],
-                cwd=str(vpn_script.parent),
-                check=False
-            )
-            
-            if result.returncode == 0:
-                logger.info("VPN CLI exited successfully")
-            else:
-                logger.warning(f"VPN CLI exited with code {result.returncode}")
-                
-        except KeyboardInterrupt:
-            print("\n\033[93m⚠️  VPN CLI interrupted\033[0m")
-            logger.info("VPN CLI interrupted by user")
-        except Exception as e:
-            logger.error(f"VPN CLI error: {str(e)}")
-            print(f"\n\033[91m✗ Error: {str(e)}\033[0m")
-        
-        self.pause()
+        self._run_submodule("vpn")
 
-    # ==================== TOOL 3: EMAIL CLI ====================
     def tool_email(self):
         """Execute the Email CLI tool from git submodule."""
-        clear_screen()
-        print("\n" + "=" * 78)
-        print("                    📧 Email CLI - Temporary Email Manager")
-        print("=" * 78)
-        print("\n\033[96mLaunching Email CLI...\033[0m\n")
-        
-        # Get path to Email CLI script
-        project_root = Path(__file__).parent.parent.parent
-        email_script = project_root / "modules" / "email-cli" / "email"
-        
-        if not email_script.exists():
-            print(f"\n\033[91m✗ Error: Email CLI not found at {email_script}\033[0m")
-            print("\033[93m⚠️  Make sure git submodules are initialized:\033[0m")
-            print("    git submodule update --init --recursive\n")
-            self.pause()
-            return
-        
-        logger.info("Tool: Email CLI launched")
-        
-        try:
-            # Execute Email CLI in interactive mode
-            result = subprocess.run(
-                [str(email_script)],
-                cwd=str(email_script.parent),
-                check=False
-            )
+        self._run_submodule("email")
+
+    def _run_submodule(self, key: str):
+        """
+        Launch a submodule CLI script interactively and wait for it to exit.
+        
+        Args:
+            key: Key into _SUBMODULE_TOOLS ("gps", "vpn" or "email")
+        """
+        name, script, header = _SUBMODULE_TOOLS[key]
+        with self._tool_frame(header):
+            print("\n" + c("96", f"Launching {name}...") + "\n")
             
-            if result.returncode == 0:
-                logger.info("Email CLI exited successfully")
-            else:
-                logger.warning(f"Email CLI exited with code {result.returncode}")
+            if script not in _found_scripts:
+                if not script.exists():
+                    print("\n" + c("91", f"✗ Error: {name} not found at {script}"))
+                    print(c("93", "⚠️  Make sure git submodules are initialized:"))
+                    print("    git submodule update --init --recursive\n")
+                    return
+                _found_scripts.add(script)
+            
+            logger.info(f"Tool: {name} launched")
+            
+            try:
+                # Execute the CLI in interactive mode
+                result = subprocess.run(
+                    [str(script)],
+                    cwd=str(script.parent),
+                    check=False
+                )
                 
-        except KeyboardInterrupt:
-            print("\n\033[93m⚠️  Email CLI interrupted\033[0m")
-            logger.info("Email CLI interrupted by user")
-        except Exception as e:
-            logger.error(f"Email CLI error: {str(e)}")
-            print(f"\n\033[91m✗ Error: {str(e)}\033[0m")
-        
-        self.pause()
+                if result.returncode == 0:
+                    logger.info(f"{name} exited successfully")
+                else:
+                    logger.warning(f"{name} exited with code {result.returncode}")
+                    
+            except KeyboardInterrupt:
+                print("\n" + c("93", f"⚠️  {name} interrupted"))
+                logger.info(f"{name} interrupted by user")
+            except Exception as e:
+                logger.error(f"{name} error: {str(e)}")
+                print("\n" + c("91", f"✗ Error: {str(e)}"))
 
     # ==================== TOOL 1: PING URL ====================
     def tool_ping(self):
         """Execute the ping URL tool."""
-        clear_screen()
-        print("\n" + "=" * 78)
-        print("                          🌐 PING URL - Test Availability")
-        print("=" * 78)
-        
-        url = self.get_url_input("Enter URL to ping")
-        if not url:
-            return
-        
+        with self._tool_frame(_PING_HEADER):
+            url = self.get_url_input("Enter URL to ping")
+            if url:
+                self._run_ping(url)
+
+    def _run_ping(self, url: str) -> bool:
+        """Ping the URL and print the results."""
         logger.info(f"Tool: Ping URL - Target: {url}")
-        print("\n\033[93m⏳ Pinging URL...\033[0m")
+        print("\n" + c("93", "⏳ Pinging URL..."))
         
         try:
-            result = ping_url(url)
+            from services.ping import ping_url
+            result = ping_url(url, session=self.session)
             
             logger.info(f"Ping successful - Status: {result['status_code']}, Time: {result['response_time_ms']}ms")
             
-            print("\n" + "=" * 78)
-            print("                               RESULTS")
-            print("=" * 78)
-            print(f"\n\033[92m✓ Success!\033[0m")
-            print(f"  URL:           {url}")
-            print(f"  Status Code:   {result['status_code']}")
-            print(f"  Response Time: {result['response_time_ms']} ms")
-            print()
+            _write(
+                _RESULTS_HEADER
+                + "\n" + c("92", "✓ Success!") + "\n"
+                f"  URL:           {url}\n"
+                f"  Status Code:   {result['status_code']}\n"
+                f"  Response Time: {result['response_time_ms']} ms\n\n"
+            )
+            return True
             
         except Exception as e:
             logger.error(f"Ping failed - URL: {url}, Error: {str(e)}")
-            print(f"\n\033[91m✗ Error: {str(e)}\033[0m")
-        
-        self.pause()
+            print("\n" + c("91", f"✗ Error: {str(e)}"))
+            return False
 
     # ==================== TOOL 2: CLONE WEBSITE ====================
     def tool_clone(self):
         """Execute the website cloning tool."""
-        clear_screen()
-        print("\n" + "=" * 78)
-        print("                      📋 CLONE WEBSITE - Download Resources")
-        print("=" * 78)
-        
-        url = self.get_url_input("Enter website URL to clone")
-        if not url:
-            return
-        
-        # Get output directory
-        default_output = get_clone_output_dir()
-        try:
-            print(f"\n\033[90mDefault output directory: {default_output}\033[0m")
-            custom_dir = input("\033[96mCustom subdirectory name (press Enter for default): \033[0m").strip()
-            if custom_dir:
-                # User provided a custom name, use it within OUTPUT_DIR
-                output_dir = str(get_output_dir() / custom_dir)
-            else:
-                # Use default from config - pass None to let clone service use its default
-                output_dir = None
-        except (EOFError, KeyboardInterrupt):
-            print("\n\033[93m⚠️  Input cancelled\033[0m")
-            return
-        
-        output_display = output_dir if output_dir else str(default_output)
+        with self._tool_frame(_CLONE_HEADER):
+            url = self.get_url_input("Enter website URL to clone")
+            if not url:
+                return
+            
+            # Get output directory
+            default_output = self._default_clone_dir
+            try:
+                print("\n" + c("90", f"Default output directory: {default_output}"))
+                custom_dir = _prompt(c("96", "Custom subdirectory name (press Enter for default): ")).strip()
+                if custom_dir:
+                    # User provided a custom name, use it within OUTPUT_DIR
+                    output_dir = str(get_output_dir() / custom_dir)
+                else:
+                    # Use default from config - pass None to let clone service use its default
+                    output_dir = None
+            except _INPUT_CANCELLED:
+                print("\n" + c("93", "⚠️  Input cancelled"))
+                return
+            
+            self._run_clone(url, output_dir)
+
+    def _run_clone(self, url: str, output_dir: Optional[str] = None) -> bool:
+        """Clone the website into output_dir (None = configured default)."""
+        output_display = output_dir if output_dir else str(self._default_clone_dir)
         logger.info(f"Tool: Clone Website - Target: {url}, Output: {output_display}")
-        print(f"\n\033[93m⏳ Cloning website to '{output_display}'...\033[0m\n")
+        print("\n" + c("93", f"⏳ Cloning website to '{output_display}'...") + "\n")
         print("-" * 78)
         
         try:
-            success = clone_website(url, output_dir)
+            from services.clone import clone_website
+            # None when the worker was abandoned after a second Ctrl+C
+            success = bool(self._run_blocking(
+                clone_website,
+                url=url,
+                output_dir=output_dir,
+                session=self.session
+            ))
             
             if success:
                 logger.info(f"Clone successful - URL: {url}, Output: {output_display}")
-                print("\n" + "=" * 78)
-                print(f"\n\033[92m✓ Website cloned successfully to: {output_display}/\033[0m")
+                print("\n" + _SEPARATOR)
+                print("\n" + c("92", f"✓ Website cloned successfully to: {output_display}/"))
                 print()
             else:
                 logger.warning(f"Clone failed - URL: {url}")
-                print("\n\033[91m✗ Failed to clone website\033[0m")
+                print("\n" + c("91", "✗ Failed to clone website"))
+            return success
                 
         except Exception as e:
             logger.error(f"Clone error - URL: {url}, Error: {str(e)}")
-            print(f"\n\033[91m✗ Error: {str(e)}\033[0m")
-        
-        self.pause()
+            print("\n" + c("91", f"✗ Error: {str(e)}"))
+            return False
 
     # ==================== TOOL 3: DDOS TEST (OFFENSIVE) ====================
     def tool_ddos(self):
         """Execute the DDoS/rate limiting test tool."""
-        clear_screen()
-        print("\n" + "=" * 78)
-        print("                  💥 DDOS TEST - Rate Limiting Analysis")
-        print("=" * 78)
-        print("\n\033[91m⚠️  OFFENSIVE TOOL - Ensure you have authorization!\033[0m")
-        
-        if not self.get_yes_no("Do you have authorization to test this target?"):
-            print("\n\033[93m⚠️  Test cancelled - Authorization required\033[0m")
-            self.pause()
-            return
-        
-        url = self.get_url_input("Enter target URL")
-        if not url:
-            return
-        
-        # Get configuration
-        try:
-            period_input = input("\n\033[96mRequest interval in seconds (default: 1.0): \033[0m").strip()
-            period = float(period_input) if period_input else 1.0
+        with self._tool_frame(_DDOS_HEADER):
+            print("\n" + c("91", "⚠️  OFFENSIVE TOOL - Ensure you have authorization!"))
             
-            max_input = input("\033[96mMaximum attempts (default: unlimited, press Enter): \033[0m").strip()
-            max_attempts = int(max_input) if max_input else None
+            if not self.get_yes_no("Do you have authorization to test this target?"):
+                print("\n" + c("93", "⚠️  Test cancelled - Authorization required"))
+                return
             
-        except ValueError:
-            print("\n\033[91m✗ Invalid input - using defaults\033[0m")
-            period = 1.0
-            max_attempts = None
-        except (EOFError, KeyboardInterrupt):
-            print("\n\033[93m⚠️  Input cancelled\033[0m")
-            return
-        
-        print("\n" + "=" * 78)
+            url = self.get_url_input("Enter target URL")
+            if not url:
+                return
+            
+            # Get configuration
+            try:
+                period_input = _prompt("\n" + c("96", "Request interval in seconds (default: 1.0): "))
+                period = _parse_number(period_input, float, 1.0, minimum=_MIN_DELAY)
+                
+                max_input = _prompt(c("96", "Maximum attempts (default: unlimited, press Enter): "))
+                max_attempts = _parse_number(max_input, int, None, minimum=_MIN_MAX_ATTEMPTS)
+                
+            except _INPUT_CANCELLED:
+                print("\n" + c("93", "⚠️  Input cancelled"))
+                return
+            
+            self._run_ddos(url, period, max_attempts)
+
+    def _run_ddos(self, url: str, period: float = 1.0, max_attempts: Optional[int] = None) -> bool:
+        """Run the rate limiting test against the URL."""
+        print("\n" + _SEPARATOR)
         print(f"Starting DDoS test on: {url}")
         print(f"Interval: {period}s | Max attempts: {max_attempts or 'Unlimited'}")
         print("Press Ctrl+C to stop")
-        print("=" * 78 + "\n")
+        print(_SEPARATOR + "\n")
         
         try:
-            result = make_requests_until_blocked(
+            from services.d2 import make_requests_until_blocked
+            result = self._run_blocking(
+                make_requests_until_blocked,
                 url=url,
                 period=period,
                 max_attempts=max_attempts,
                 randomize_params=True,
-                verbose=True
+                verbose=True,
+                session=self.session
             )
         except Exception as e:
-            print(f"\n\033[91m✗ Error: {str(e)}\033[0m")
-        
-        self.pause()
+            print("\n" + c("91", f"✗ Error: {str(e)}"))
+            return False
+        # Being blocked is the finding; failing before any request got through is not
+        return (
+            result is not None
+            and result['success_count'] > 0
+            and (result['blocked'] or not result['error_message'])
+        )
 
     # ==================== TOOL 4: LOGIN TEST (OFFENSIVE) ====================
     def tool_login(self):
         """Execute the login credential testing tool."""
-        clear_screen()
-        print("\n" + "=" * 78)
-        print("               🔐 LOGIN TEST - Credential Combination Testing")
-        print("=" * 78)
-        print("\n\033[91m⚠️  OFFENSIVE TOOL - Ensure you have authorization!\033[0m")
-        
-        if not self.get_yes_no("Do you have authorization to test this target?"):
-            print("\n\033[93m⚠️  Test cancelled - Authorization required\033[0m")
-            self.pause()
-            return
+        with self._tool_frame(_LOGIN_HEADER):
+            print("\n" + c("91", "⚠️  OFFENSIVE TOOL - Ensure you have authorization!"))
+            
+            if not self.get_yes_no("Do you have authorization to test this target?"):
+                print("\n" + c("93", "⚠️  Test cancelled - Authorization required"))
+                return
+            
+            cfg = self._bulk_input(_LOGIN_FORM)
+            if cfg is None:
+                return
+            if cfg and not (cfg.get("url") and cfg.get("emails") and cfg.get("keywords")):
+                print(c("91", "✗ url, emails and keywords are required - switching to step-by-step prompts"))
+                cfg = {}
+            
+            if cfg:
+                url = cfg["url"]
+                if not url.startswith(URL_SCHEMES):
+                    url = f"https://{url}"
+                emails = cfg["emails"]
+                keywords = cfg["keywords"]
+                delay = cfg.get("delay", 1.0)
+                max_attempts = cfg.get("max_attempts")
+            else:
+                config = self._prompt_login_config()
+                if config is None:
+                    return
+                url, emails, keywords, delay, max_attempts = config
+            
+            self._run_login(url, emails, keywords, delay, max_attempts)
+
+    def _run_login(
+        self,
+        url: str,
+        emails: Iterable[str],
+        keywords: List[str],
+        delay: float = 1.0,
+        max_attempts: Optional[int] = None
+    ) -> bool:
+        """Run the credential combination test against the login URL."""
+        print("\n" + _SEPARATOR)
+        print(f"Starting login test on: {url}")
+        email_count = len(emails) if isinstance(emails, Sized) else "streamed"
+        print(f"Emails: {email_count} | Keywords: {len(keywords)} | Delay: {delay}s")
+        print("Press Ctrl+C to stop")
+        print(_SEPARATOR + "\n")
         
+        try:
+            from services.attempt_login import attempt_credential_combinations
+            result = self._run_blocking(
+                attempt_credential_combinations,
+                url=url,
+                emails=emails,
+                keywords=keywords,
+                delay=delay,
+                max_attempts=max_attempts,
+                verbose=True,
+                session=self.session
+            )
+        except Exception as e:
+            print("\n" + c("91", f"✗ Error: {str(e)}"))
+            return False
+        return result is not None and not result['error_message'] and result['attempts'] > 0
+
+    def _prompt_login_config(self) -> Optional[Tuple[str, Iterable[str], List[str], float, Optional[int]]]:
+        """
+        Prompt for the login tool settings one field at a time.
+
+        Returns:
+            Tuple of (url, emails, keywords, delay, max_attempts), or None if cancelled
+        """
         url = self.get_url_input("Enter login page URL")
         if not url:
-            return
+            return None
         
         # Get emails
-        print("\n\033[96mEnter email addresses to test (comma-separated):\033[0m")
-        print("\033[90mExample: admin@site.com, user@site.com, test@site.com\033[0m")
+        print("\n" + c("96", "Enter email addresses to test (comma-separated, or @wordlist.txt):"))
+        print(c("90", "Example: admin@site.com, user@site.com, test@site.com"))
         try:
-            emails_input = input("\033[96mEmails: \033[0m").strip()
+            emails_input = _prompt(c("96", "Emails: ")).strip()
             if not emails_input:
-                print("\n\033[91m✗ Error: At least one email is required\033[0m")
-                self.pause()
-                return
-            emails = [e.strip() for e in emails_input.split(',') if e.strip()]
-        except (EOFError, KeyboardInterrupt):
-            print("\n\033[93m⚠️  Input cancelled\033[0m")
-            return
+                print("\n" + c("91", "✗ Error: At least one email is required"))
+                return None
+            emails = _parse_emails(emails_input)
+            if not emails:
+                print("\n" + c("91", "✗ Error: At least one valid email is required"))
+                return None
+        except _INPUT_CANCELLED:
+            print("\n" + c("93", "⚠️  Input cancelled"))
+            return None
         
         # Get password keywords
-        print("\n\033[96mEnter password keywords (comma-separated):\033[0m")
-        print("\033[90mExample: password, admin, welcome\033[0m")
+        print("\n" + c("96", "Enter password keywords (comma-separated, or @wordlist.txt):"))
+        print(c("90", "Example: password, admin, welcome"))
         try:
-            keywords_input = input("\033[96mKeywords: \033[0m").strip()
+            keywords_input = _prompt(c("96", "Keywords: ")).strip()
             if not keywords_input:
-                print("\n\033[91m✗ Error: At least one keyword is required\033[0m")
-                self.pause()
-                return
-            keywords = [k.strip() for k in keywords_input.split(',') if k.strip()]
-        except (EOFError, KeyboardInterrupt):
-            print("\n\033[93m⚠️  Input cancelled\033[0m")
-            return
+                print("\n" + c("91", "✗ Error: At least one keyword is required"))
+                return None
+            keywords = _parse_keywords(keywords_input)
+            if not keywords:
+                print("\n" + c("91", "✗ Error: At least one keyword is required"))
+                return None
+        except _INPUT_CANCELLED:
+            print("\n" + c("93", "⚠️  Input cancelled"))
+            return None
         
         # Get delay
         try:
-            delay_input = input("\n\033[96mDelay between attempts in seconds (default: 1.0): \033[0m").strip()
-            delay = float(delay_input) if delay_input else 1.0
+            delay_input = _prompt("\n" + c("96", "Delay between attempts in seconds (default: 1.0): "))
+            delay = _parse_number(delay_input, float, 1.0, minimum=_MIN_DELAY)
             
-            max_input = input("\033[96mMaximum attempts (default: unlimited, press Enter): \033[0m").strip()
-            max_attempts = int(max_input) if max_input else None
-        except ValueError:
-            print("\n\033[91m✗ Invalid input - using defaults\033[0m")
-            delay = 1.0
-            max_attempts = None
-        except (EOFError, KeyboardInterrupt):
-            print("\n\033[93m⚠️  Input cancelled\033[0m")
-            return
-        
-        print("\n" + "=" * 78)
-        print(f"Starting login test on: {url}")
-        print(f"Emails: {len(emails)} | Keywords: {len(keywords)} | Delay: {delay}s")
-        print("Press Ctrl+C to stop")
-        print("=" * 78 + "\n")
-        
-        try:
-            result = attempt_credential_combinations(
-                url=url,
-                emails=emails,
-                keywords=keywords,
-                delay=delay,
-                max_attempts=max_attempts,
-                verbose=True
-            )
-        except Exception as e:
-            print(f"\n\033[91m✗ Error: {str(e)}\033[0m")
+            max_input = _prompt(c("96", "Maximum attempts (default: unlimited, press Enter): "))
+            max_attempts = _parse_number(max_input, int, None, minimum=_MIN_MAX_ATTEMPTS)
+        except _INPUT_CANCELLED:
+            print("\n" + c("93", "⚠️  Input cancelled"))
+            return None
         
-        self.pause()
+        return url, emails, keywords, delay, max_attempts
 
     # ==================== MAIN RUN LOOP ====================
     def run(self):
@@ -460,8 +764,8 @@ class PentestMenu:
         print_warning()
         
         if not self.get_yes_no("\nDo you acknowledge the legal warning and agree to use these tools responsibly?"):
-            print("\n\033[93m⚠️  You must acknowledge the warning to continue.\033[0m")
-            print("\033[90mExiting...\033[0m\n")
+            print("\n" + c("93", "⚠️  You must acknowledge the warning to continue."))
+            print(c("90", "Exiting...") + "\n")
             sys.exit(0)
         
         while self.running:
@@ -471,46 +775,189 @@ class PentestMenu:
             
             choice = self.get_choice()
             
-            if choice == "1":
-                self.tool_gps()
-            elif choice == "2":
-                self.tool_vpn()
-            elif choice == "3":
-                self.tool_email()
-            elif choice == "4":
-                self.tool_ping()
-            elif choice == "5":
-                self.tool_clone()
-            elif choice == "6":
-                self.tool_ddos()
-            elif choice == "7":
-                self.tool_login()
-            elif choice == "0":
-                self.running = False
-                clear_screen()
-                print("\n\033[92m" + "=" * 78 + "\033[0m")
-                print("\033[92m                    Thank you for using PenWeb!\033[0m")
-                print("\033[92m                      🛡️🔐 Stay safe. Stay legal.\033[0m")
-                print("\033[92m" + "=" * 78 + "\033[0m\n")
-            else:
-                print("\n\033[91m✗ Invalid choice. Please select 0-7.\033[0m")
-                self.pause()
+            handler = self._dispatch.get(choice, self._invalid_choice)
+            handler()
+
+    def _exit(self):
+        """Stop the run loop and show the goodbye banner."""
+        self.running = False
+        clear_screen()
+        _write(_EXIT_BANNER)
+
+    def _invalid_choice(self):
+        """Report an unrecognised menu choice."""
+        print("\n" + c("91", "✗ Invalid choice. Please select 0-7."))
+        self.pause()
+
+    # ==================== SCRIPTED MODE ====================
+    def run_scripted(self, args: argparse.Namespace) -> int:
+        """
+        Run a single tool from command-line arguments without interactive prompts.
+        
+        Args:
+            args: Parsed command-line arguments (see _build_arg_parser)
+            
+        Returns:
+            Process exit code (0 = success)
+        """
+        if not args.yes:
+            print_warning()
+            if not self.get_yes_no("Do you acknowledge the legal warning and agree to use these tools responsibly?"):
+                print("\n" + c("93", "⚠️  You must acknowledge the warning to continue."))
+                return 1
+            if args.tool in _OFFENSIVE_TOOLS and \
+               not self.get_yes_no("Do you have authorization to test this target?"):
+                print("\n" + c("93", "⚠️  Test cancelled - Authorization required"))
+                return 1
+        
+        url = args.url
+        if not url.startswith(URL_SCHEMES):
+            url = f"https://{url}"
+        if not parse_url(url).netloc:
+            print(c("91", "✗ Error: URL must include a host name"))
+            return 1
+        
+        if args.tool == "ping":
+            ok = self._run_ping(url)
+        elif args.tool == "clone":
+            output_dir = str(get_output_dir() / args.output) if args.output else None
+            ok = self._run_clone(url, output_dir)
+        elif args.tool == "ddos":
+            ok = self._run_ddos(url, args.period, args.max_attempts)
+        else:
+            emails = _parse_emails(args.emails)
+            keywords = _parse_keywords(args.keywords)
+            if not emails or not keywords:
+                print(c("91", "✗ Error: At least one valid email and one keyword are required"))
+                return 1
+            ok = self._run_login(url, emails, keywords, args.delay, args.max_attempts)
+        
+        return 0 if ok else 1
+
+
+_OFFENSIVE_TOOLS = frozenset(("ddos", "login"))
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser for scripted (non-interactive) runs."""
+    parser = argparse.ArgumentParser(
+        prog='penweb',
+        description='Website penetration testing toolkit. '
+                    'Run without --tool to open the interactive menu.'
+    )
+    parser.add_argument(
+        '--tool',
+        choices=['ping', 'clone', 'ddos', 'login'],
+        help='Run a single tool non-interactively'
+    )
+    parser.add_argument(
+        '--exec-tool',
+        choices=sorted(_SUBMODULE_TOOLS),
+        help='Replace this process with a submodule CLI (no menu, no child process)'
+    )
+    parser.add_argument('--url', help='Target URL')
+    parser.add_argument('--output', help='Clone: subdirectory name inside OUTPUT_DIR')
+    parser.add_argument(
+        '--period',
+        type=float,
+        default=1.0,
+        help='DDoS: interval between requests in seconds (default: 1.0)'
+    )
+    parser.add_argument('--emails', help='Login: comma-separated email addresses')
+    parser.add_argument('--keywords', help='Login: comma-separated password keywords')
+    parser.add_argument(
+        '--delay',
+        type=float,
+        default=1.0,
+        help='Login: delay between attempts in seconds (default: 1.0)'
+    )
+    parser.add_argument(
+        '--max-attempts',
+        type=int,
+        default=None,
+        help='DDoS/Login: maximum number of attempts (default: unlimited)'
+    )
+    parser.add_argument(
+        '--yes',
+        action='store_true',
+        help='Acknowledge the legal warning and confirm authorization to test the target'
+    )
+    return parser
+
+
+def _exec_submodule(key: str, acknowledged: bool = False):
+    """
+    Replace the current process with a submodule CLI via os.execv.
+    
+    Nothing runs after the submodule exits, so there is no reason to keep the
+    Python interpreter alive alongside it.
+    
+    Args:
+        key: Key into _SUBMODULE_TOOLS ("gps", "vpn" or "email")
+        acknowledged: Whether the legal warning was acknowledged with --yes
+    """
+    name, script, _ = _SUBMODULE_TOOLS[key]
+    if not script.exists():
+        print(c("91", f"✗ Error: {name} not found at {script}"))
+        print(c("93", "⚠️  Make sure git submodules are initialized:"))
+        print("    git submodule update --init --recursive\n")
+        sys.exit(1)
+    
+    if not acknowledged:
+        print_warning()
+        if not PentestMenu().get_yes_no("Do you acknowledge the legal warning and agree to use these tools responsibly?"):
+            print("\n" + c("93", "⚠️  You must acknowledge the warning to continue."))
+            sys.exit(1)
+    
+    logger.info(f"Tool: {name} exec'd")
+    sys.stdout.flush()
+    os.chdir(script.parent)
+    os.execv(str(script), [str(script)])
 
 
-def start_cli():
-    """Start the CLI application."""
+def start_cli(argv: Optional[List[str]] = None):
+    """
+    Start the CLI application.
+    
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+    """
+    parser = _build_arg_parser()
+    args = parser.parse_args(argv)
+    if args.tool and args.exec_tool:
+        parser.error("--tool and --exec-tool cannot be combined")
+    if args.exec_tool:
+        _exec_submodule(args.exec_tool, args.yes)
+    if args.tool:
+        if not args.url:
+            parser.error("--url is required with --tool")
+        if args.tool == "login" and not (args.emails and args.keywords):
+            parser.error("--emails and --keywords are required with --tool login")
+        if args.period < 0 or args.delay < 0:
+            parser.error("--period and --delay must be non-negative")
+        if args.max_attempts is not None and args.max_attempts <= 0:
+            parser.error("--max-attempts must be positive")
+    
+    # Flush progress messages per line even when stdout is piped (e.g. into tee)
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
+    
     try:
         logger.info("PenWeb CLI started")
         menu = PentestMenu()
+        if args.tool:
+            exit_code = menu.run_scripted(args)
+            logger.info(f"PenWeb scripted run finished with exit code {exit_code}")
+            sys.exit(exit_code)
         menu.run()
         logger.info("PenWeb CLI exited normally")
     except KeyboardInterrupt:
         logger.warning("Application interrupted by user")
-        print("\n\n\033[93m⚠️  Application interrupted by user\033[0m")
-        print("\033[90mExiting...\033[0m\n")
+        print("\n\n" + c("93", "⚠️  Application interrupted by user"))
+        print(c("90", "Exiting...") + "\n")
         sys.exit(0)
     except Exception as e:
         logger.error(f"Fatal error in CLI: {str(e)}")
-        print(f"\n\033[91m✗ Fatal error: {str(e)}\033[0m\n")
+        print("\n" + c("91", f"✗ Fatal error: {str(e)}") + "\n")
         sys.exit(1)
 
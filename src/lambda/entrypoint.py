@@ -1,24 +1,71 @@
 """AWS Lambda function to process URLs from SQS messages with various actions."""
 import logging
-from typing import Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional
 
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 try:
-    from utils.ping import ping_url
+    from services.ping import ping_url, ping_url_pooled
 except ImportError:
     # For testing purposes, create a mock ping function
-    def ping_url(url: str) -> dict:
+    def ping_url(url: str, timeout: int = 10, session: Optional[Any] = None) -> Dict[str, Any]:
         return {"status_code": 200, "response_time_ms": 100}
+    ping_url_pooled = None  # type: ignore[assignment]
 
-from lib import instruction_parser, extract_message_metadata, create_response
+from utils.sqs import instruction_parser, create_response
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Only the most recent operations of each kind are echoed back in the response;
+# totals are always exact
+MAX_RESULT_SAMPLES = 100
+
+# Upper bound on concurrent actions (and pooled connections) per invocation
+MAX_WORKERS = 32
+
+# Created at module scope so warm invocations keep reusing TCP/TLS connections;
+# building the TLS context here also moves that cost into the Lambda init phase
+http_pool: Optional[Any]
+try:
+    import ssl
+    import urllib3
+    http_pool = urllib3.PoolManager(
+        num_pools=MAX_WORKERS,
+        maxsize=MAX_WORKERS,
+        # Follow redirects like the urllib and requests ping paths, but never retry
+        retries=urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=5),
+        timeout=urllib3.Timeout(connect=3, read=10),
+        ssl_context=ssl.create_default_context()
+    )
+except ImportError:
+    http_pool = None
+
+
+def _prewarm_dns(hosts: str) -> None:
+    """
+    Resolve frequently pinged hosts during init so first requests skip the lookup.
+    
+    Args:
+        hosts: Comma-separated host names (PREWARM_HOSTS environment variable)
+    """
+    import socket
+    
+    for host in filter(None, (h.strip() for h in hosts.split(','))):
+        try:
+            socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        except OSError as e:
+            logger.warning("Could not prewarm DNS for %s: %s", host, e)
+
+
+if os.environ.get('PREWARM_HOSTS'):
+    _prewarm_dns(os.environ['PREWARM_HOSTS'])
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
@@ -40,72 +87,79 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         context: Lambda context object
         
     Returns:
-        Dictionary with processing results
+        Dictionary with processing results. Counts cover every record, while
+        successful_operations/failed_operations hold at most MAX_RESULT_SAMPLES
+        of the most recent entries each.
     """
-    successful_operations = []
-    failed_operations = []
-    
-    # Process each SQS record
-    for record in event.get('Records', []):
-        message_metadata = extract_message_metadata(record)
-        message_id = message_metadata['message_id']
-        message_body = record.get('body', '')
+    records = event.get('Records', [])
+    successful_operations: Deque[Dict[str, Any]] = deque(maxlen=MAX_RESULT_SAMPLES)
+    failed_operations: Deque[Dict[str, Any]] = deque(maxlen=MAX_RESULT_SAMPLES)
+    successful_count = 0
+    failed_count = 0
+    tasks = []
+    
+    # Bound once per invocation; the loops below log per record
+    _info = logger.info
+    _error = logger.error
+    _enabled = logger.isEnabledFor(logging.INFO)
+    
+    # Stage 1: parse every record in one pass; invalid messages fail immediately.
+    # instruction_parser never raises, so no per-record try/except is needed.
+    parsed = [
+        (record.get('messageId', 'unknown'), instruction_parser(record.get('body', '')))
+        for record in records
+    ]
+    
+    for message_id, instruction in parsed:
+        if instruction['status'] == 0:
+            # Invalid message
+            failed_count += 1
+            failed_operations.append({
+                'message_id': message_id,
+                'url': instruction.get('url', 'unknown'),
+                'action': instruction.get('action', 'unknown'),
+                'error': instruction['error']
+            })
+            _error("Invalid message %s: %s", message_id, instruction['error'])
+            continue
         
-        try:
-            # Parse instruction using utility function
-            instruction = instruction_parser(message_body)
-            
-            if instruction['status'] == 0:
-                # Invalid message
-                failed_operations.append({
-                    'message_id': message_id,
-                    'url': instruction.get('url', 'unknown'),
-                    'action': instruction.get('action', 'unknown'),
-                    'error': instruction['error']
-                })
-                logger.error(f"Invalid message {message_id}: {instruction['error']}")
-                continue
-            
-            # Valid instruction
-            url = instruction['url']
-            action = instruction['action']
-            
-            logger.info(f"Processing message {message_id}: URL={url}, Action={action}")
-            
-            # Execute the requested action
-            result = execute_action(url, action, message_id)
-            
-            if result['success']:
-                successful_operations.append({
-                    'message_id': message_id,
-                    'url': url,
-                    'action': action,
-                    'result': result['data']
-                })
-                logger.info(f"Successfully executed {action} on {url}")
-            else:
-                failed_operations.append({
-                    'message_id': message_id,
-                    'url': url,
-                    'action': action,
-                    'error': result['error']
-                })
-                logger.error(f"Failed to execute {action} on {url}: {result['error']}")
-            
-        except Exception as e:
-            error_msg = str(e)
-            logger.error(f"Unexpected error processing message {message_id}: {error_msg}")
+        if _enabled:
+            _info("Processing message %s: URL=%s, Action=%s", message_id, instruction['url'], instruction['action'])
+        tasks.append((message_id, instruction['url'], instruction['action']))
+    
+    # Stage 2: execute the requested actions concurrently (network-bound)
+    results = []
+    if tasks:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(tasks))) as executor:
+            results = list(executor.map(
+                lambda task: execute_action(task[1], task[2], task[0]),
+                tasks
+            ))
+    
+    # Stage 3: collect results in message order
+    for (message_id, url, action), result in zip(tasks, results):
+        if result['success']:
+            successful_count += 1
+            successful_operations.append({
+                'message_id': message_id,
+                'url': url,
+                'action': action,
+                'result': result['data']
+            })
+            if _enabled:
+                _info("Successfully executed %s on %s", action, url)
+        else:
+            failed_count += 1
             failed_operations.append({
                 'message_id': message_id,
-                'url': 'unknown',
-                'action': 'unknown',
-                'error': f"Unexpected error: {error_msg}"
+                'url': url,
+                'action': action,
+                'error': result['error']
             })
+            _error("Failed to execute %s on %s: %s", action, url, result['error'])
     
     # Return summary
-    total_processed = len(event.get('Records', []))
-    successful_count = len(successful_operations)
-    failed_count = len(failed_operations)
+    total_processed = len(records)
     
     result = create_response(
         status_code=200 if not failed_count else 207,  # 207 Multi-Status if partial success
@@ -114,23 +168,91 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'total_processed': total_processed,
             'successful': successful_count,
             'failed': failed_count,
-            'successful_operations': successful_operations,
-            'failed_operations': failed_operations
+            'successful_operations': list(successful_operations),
+            'failed_operations': list(failed_operations)
         }
     )
     
-    logger.info(f"Processing complete: {successful_count} successful, {failed_count} failed")
+    if _enabled:
+        _info("Processing complete: %d successful, %d failed", successful_count, failed_count)
     
     return result
 
 
+def _do_ping(url: str) -> Dict[str, Any]:
+    """Ping the URL, through the shared connection pool when available."""
+    if http_pool is not None and ping_url_pooled is not None:
+        response = ping_url_pooled(url, http_pool)
+    else:
+        response = ping_url(url)
+    return {
+        'success': True,
+        'data': {
+            'status_code': response['status_code'],
+            'response_time_ms': response['response_time_ms']
+        },
+        'error': None
+    }
+
+
+def _do_clone(url: str) -> Dict[str, Any]:
+    """Clone the website."""
+    # TODO: Implement clone functionality
+    # For now, return a placeholder
+    return {
+        'success': True,
+        'data': {
+            'message': 'Clone functionality not yet implemented',
+            'url': url
+        },
+        'error': None
+    }
+
+
+def _do_ddos(url: str) -> Dict[str, Any]:
+    """Run the rate limiting test."""
+    # TODO: Implement DDoS functionality (for testing purposes only)
+    # For now, return a placeholder
+    return {
+        'success': True,
+        'data': {
+            'message': 'DDoS functionality not yet implemented',
+            'url': url
+        },
+        'error': None
+    }
+
+
+def _do_attempt_login(url: str) -> Dict[str, Any]:
+    """Run the login attempt test."""
+    # TODO: Implement login attempt functionality
+    # For now, return a placeholder
+    return {
+        'success': True,
+        'data': {
+            'message': 'Login attempt functionality not yet implemented',
+            'url': url
+        },
+        'error': None
+    }
+
+
+# Action name -> handler; each returns the execute_action result dictionary
+_HANDLERS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    'ping': _do_ping,
+    'clone': _do_clone,
+    'ddos': _do_ddos,
+    'attempt_login': _do_attempt_login,
+}
+
+
 def execute_action(url: str, action: str, message_id: str) -> Dict[str, Any]:
     """
     Execute the specified action on the given URL.
     
     Args:
         url: URL to process
-        action: Action to perform
+        action: Action to perform (a key of _HANDLERS)
         message_id: Message ID for logging
         
     Returns:
@@ -141,65 +263,19 @@ def execute_action(url: str, action: str, message_id: str) -> Dict[str, Any]:
             "error": str (if failed)
         }
     """
+    handler = _HANDLERS.get(action)
+    if handler is None:
+        return {
+            'success': False,
+            'data': None,
+            'error': f"Unknown action: {action}"
+        }
+    
     try:
-        if action == 'ping':
-            response = ping_url(url)
-            return {
-                'success': True,
-                'data': {
-                    'status_code': response['status_code'],
-                    'response_time_ms': response['response_time_ms']
-                },
-                'error': None
-            }
-        
-        elif action == 'clone':
-            # TODO: Implement clone functionality
-            # For now, return a placeholder
-            return {
-                'success': True,
-                'data': {
-                    'message': 'Clone functionality not yet implemented',
-                    'url': url
-                },
-                'error': None
-            }
-        
-        elif action == 'ddos':
-            # TODO: Implement DDoS functionality (for testing purposes only)
-            # For now, return a placeholder
-            return {
-                'success': True,
-                'data': {
-                    'message': 'DDoS functionality not yet implemented',
-                    'url': url
-                },
-                'error': None
-            }
-        
-        elif action == 'attempt_login':
-            # TODO: Implement login attempt functionality
-            # For now, return a placeholder
-            return {
-                'success': True,
-                'data': {
-                    'message': 'Login attempt functionality not yet implemented',
-                    'url': url
-                },
-                'error': None
-            }
-        
-        else:
-            return {
-                'success': False,
-                'data': None,
-                'error': f"Unknown action: {action}"
-            }
-            
+        return handler(url)
     except Exception as e:
         return {
             'success': False,
             'data': None,
             'error': f"Error executing {action} on {url}: {str(e)}"
         }
-
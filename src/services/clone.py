@@ -2,41 +2,79 @@
 Web cloning utility that downloads HTML, CSS, and JS files from a given URL.
 """
 
+import hashlib
+import importlib.util
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Set, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse, unquote
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from utils.config import get_clone_output_dir, get_output_dir
 except ImportError:
-    # Fallback if config not available
-    def get_output_dir():
+    # Fallback if config not available (cached like the config versions)
+    @lru_cache(maxsize=1)
+    def get_output_dir() -> Path:
         """Get the output directory (fallback to .output)."""
         return Path(".output")
     
-    def get_clone_output_dir(subdirectory=None):
+    @lru_cache(maxsize=32)
+    def get_clone_output_dir(subdirectory: Optional[str] = None) -> Path:
         """Get the clone output directory (fallback to .output/cloned_site)."""
-        output_dir = get_output_dir()
+        output_dir: Path = get_output_dir()
         if subdirectory:
             return output_dir / subdirectory
         else:
             return output_dir / "cloned_site"
 
+try:
+    from utils.http import parse_url
+except ImportError:
+    parse_url = lru_cache(maxsize=256)(urlparse)
+
+# Concurrent asset downloads per clone; both the cloner's own session and
+# utils.http.create_session keep at least this many connections per host
+MAX_DOWNLOAD_WORKERS = 8
+
+# url(...) references inside stylesheets
+_CSS_URL_RE = re.compile(r'url\(["\']?([^"\')]+)["\']?\)')
+
+# CSS selectors for the assets to clone (compiled and cached by soupsieve)
+_STYLESHEET_SELECTOR = 'link[rel~="stylesheet"][href]'
+_EXTERNAL_SCRIPT_SELECTOR = 'script[src]'
+_INLINE_SCRIPT_SELECTOR = 'script:not([src])'
+
+# lxml parses much faster than the pure-Python html.parser; used when installed
+_HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
 
 class WebCloner:
     """Clone a website by downloading HTML, CSS, and JS files."""
 
-    def __init__(self, url: str, output_dir: Optional[str] = None):
+    def __init__(
+        self,
+        url: str,
+        output_dir: Optional[str] = None,
+        session: Optional[Any] = None,
+        stop_event: Optional[threading.Event] = None
+    ):
         """
         Initialize the WebCloner.
 
         Args:
             url: The URL to clone
             output_dir: Directory where files will be saved (default: from OUTPUT_DIR env variable)
+            session: Optional requests.Session to reuse pooled connections; used
+                as-is, so its adapter's pool size and retries apply
+            stop_event: Optional event that cancels the clone when set (e.g. from another thread)
         """
         self.url = url
         if output_dir:
@@ -44,10 +82,29 @@ class WebCloner:
         else:
             self.output_dir = get_clone_output_dir()
         self.downloaded_files: Set[str] = set()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self._created_dirs: Set[Path] = set()
+        # Content digest -> saved path, so identical linked assets are stored once
+        self._content_paths: Dict[bytes, Path] = {}
+        if session is None:
+            session = requests.Session()
+            # One keep-alive pool slot per download worker; asset GETs are
+            # idempotent, so transient failures are retried briefly
+            adapter = HTTPAdapter(
+                pool_connections=MAX_DOWNLOAD_WORKERS,
+                pool_maxsize=MAX_DOWNLOAD_WORKERS,
+                max_retries=Retry(total=2, backoff_factor=0.2)
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+        self.session = session
+        self.stop_event = stop_event
+
+    def _cancelled(self) -> bool:
+        """Return True once a stop has been requested through stop_event."""
+        return self.stop_event is not None and self.stop_event.is_set()
 
     def clone(self) -> bool:
         """
@@ -67,7 +124,7 @@ class WebCloner:
             response.raise_for_status()
             
             # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, _HTML_PARSER)
             
             # Download CSS files
             self._download_stylesheets(soup)
@@ -75,6 +132,10 @@ class WebCloner:
             # Download JS files
             self._download_scripts(soup)
             
+            if self._cancelled():
+                print("\n⚠️  Cloning cancelled")
+                return False
+            
             # Download inline styles and scripts
             self._extract_inline_styles(soup)
             self._extract_inline_scripts(soup)
@@ -93,12 +154,43 @@ class WebCloner:
             print(f"✗ Error during cloning: {e}")
             return False
 
+    def _fetch_all(self, urls: List[str]) -> Iterator[Tuple[str, Any]]:
+        """
+        Download URLs concurrently over the shared session.
+
+        Args:
+            urls: URLs to download
+
+        Yields:
+            (url, outcome) pairs as each download finishes, where outcome is the
+            response, the requests.RequestException raised for it, or None once
+            cancelled; a slow download never holds back the finished ones
+        """
+        if not urls:
+            return
+
+        def fetch(url: str) -> Any:
+            if self._cancelled():
+                return None
+            try:
+                response = self.session.get(url, timeout=30)
+                response.raise_for_status()
+                return response
+            except requests.RequestException as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(urls))) as executor:
+            futures = {executor.submit(fetch, url): url for url in urls}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
     def _download_stylesheets(self, soup: BeautifulSoup) -> None:
         """Download all CSS files linked in the HTML."""
-        link_tags = soup.find_all('link', rel='stylesheet')
+        link_tags = soup.select(_STYLESHEET_SELECTOR)
         
         print(f"\nFound {len(link_tags)} CSS files to download:")
         
+        jobs: Dict[str, Any] = {}
         for tag in link_tags:
             href = tag.get('href')
             if not href:
@@ -106,34 +198,41 @@ class WebCloner:
                 
             css_url = urljoin(self.url, href)
             
-            if css_url in self.downloaded_files:
+            if css_url in self.downloaded_files or css_url in jobs:
                 continue
-                
-            try:
-                print(f"  Downloading CSS: {css_url}")
-                response = self.session.get(css_url, timeout=30)
-                response.raise_for_status()
-                
-                # Save CSS file
-                file_path = self._get_file_path(css_url, 'css')
-                self._save_file(file_path, response.content)
-                self.downloaded_files.add(css_url)
-                
-                # Update the link tag to point to local file
-                tag['href'] = str(file_path.relative_to(self.output_dir))
-                
-                # Download resources referenced in CSS (like @import and url())
-                self._download_css_resources(response.text, css_url)
-                
-            except requests.RequestException as e:
-                print(f"    ✗ Failed to download {css_url}: {e}")
+            
+            print(f"  Downloading CSS: {css_url}")
+            jobs[css_url] = tag
+        
+        # Only the url() targets are kept, so each stylesheet body is released
+        # as soon as it is saved
+        resource_urls: Dict[str, None] = {}
+        for css_url, response in self._fetch_all(list(jobs)):
+            if response is None:
+                return
+            if isinstance(response, requests.RequestException):
+                print(f"    ✗ Failed to download {css_url}: {response}")
+                continue
+            
+            # Save CSS file
+            file_path, is_new = self._save_asset(css_url, response.content, 'css')
+            self.downloaded_files.add(css_url)
+            
+            # Update the link tag to point to local file
+            jobs[css_url]['href'] = str(file_path.relative_to(self.output_dir))
+            if is_new:
+                resource_urls.update(dict.fromkeys(self._css_resource_urls(response.text, css_url)))
+        
+        # Download resources referenced in CSS (like @import and url()) in one batch
+        self._download_css_resources(list(resource_urls))
 
     def _download_scripts(self, soup: BeautifulSoup) -> None:
         """Download all JS files linked in the HTML."""
-        script_tags = soup.find_all('script', src=True)
+        script_tags = soup.select(_EXTERNAL_SCRIPT_SELECTOR)
         
         print(f"\nFound {len(script_tags)} JS files to download:")
         
+        jobs: Dict[str, Any] = {}
         for tag in script_tags:
             src = tag.get('src')
             if not src:
@@ -141,52 +240,49 @@ class WebCloner:
                 
             js_url = urljoin(self.url, src)
             
-            if js_url in self.downloaded_files:
+            if js_url in self.downloaded_files or js_url in jobs:
                 continue
-                
-            try:
-                print(f"  Downloading JS: {js_url}")
-                response = self.session.get(js_url, timeout=30)
-                response.raise_for_status()
-                
-                # Save JS file
-                file_path = self._get_file_path(js_url, 'js')
-                self._save_file(file_path, response.content)
-                self.downloaded_files.add(js_url)
-                
-                # Update the script tag to point to local file
-                tag['src'] = str(file_path.relative_to(self.output_dir))
-                
-            except requests.RequestException as e:
-                print(f"    ✗ Failed to download {js_url}: {e}")
+            
+            print(f"  Downloading JS: {js_url}")
+            jobs[js_url] = tag
+        
+        for js_url, response in self._fetch_all(list(jobs)):
+            if response is None:
+                return
+            if isinstance(response, requests.RequestException):
+                print(f"    ✗ Failed to download {js_url}: {response}")
+                continue
+            
+            # Save JS file
+            file_path, _ = self._save_asset(js_url, response.content, 'js')
+            self.downloaded_files.add(js_url)
+            
+            # Update the script tag to point to local file
+            jobs[js_url]['src'] = str(file_path.relative_to(self.output_dir))
+
+    def _css_resource_urls(self, css_content: str, base_url: str) -> List[str]:
+        """Return the absolute url() references in a stylesheet, skipping data URIs."""
+        return [
+            urljoin(base_url, match)
+            for match in _CSS_URL_RE.findall(css_content)
+            if not match.startswith('data:')
+        ]
 
-    def _download_css_resources(self, css_content: str, base_url: str) -> None:
+    def _download_css_resources(self, resource_urls: List[str]) -> None:
         """Download resources referenced in CSS files (like fonts, images)."""
-        # Find all url() references in CSS
-        url_pattern = r'url\(["\']?([^"\')]+)["\']?\)'
-        matches = re.findall(url_pattern, css_content)
+        # Skip resources already downloaded
+        resource_urls = [url for url in resource_urls if url not in self.downloaded_files]
         
-        for match in matches:
-            # Skip data URIs
-            if match.startswith('data:'):
+        for resource_url, response in self._fetch_all(resource_urls):
+            if response is None:
+                return
+            if isinstance(response, requests.RequestException):
+                # Silently skip failed resource downloads
                 continue
-                
-            resource_url = urljoin(base_url, match)
             
-            if resource_url in self.downloaded_files:
-                continue
-                
-            try:
-                response = self.session.get(resource_url, timeout=30)
-                response.raise_for_status()
-                
-                file_path = self._get_file_path(resource_url)
-                self._save_file(file_path, response.content)
-                self.downloaded_files.add(resource_url)
-                
-            except requests.RequestException:
-                # Silently skip failed resource downloads
-                pass
+            file_path = self._get_file_path(resource_url)
+            self._save_file(file_path, response.content)
+            self.downloaded_files.add(resource_url)
 
     def _extract_inline_styles(self, soup: BeautifulSoup) -> None:
         """Extract and save inline <style> tags."""
@@ -202,7 +298,7 @@ class WebCloner:
 
     def _extract_inline_scripts(self, soup: BeautifulSoup) -> None:
         """Extract and save inline <script> tags."""
-        script_tags = soup.find_all('script', src=False)
+        script_tags = soup.select(_INLINE_SCRIPT_SELECTOR)
         
         if script_tags:
             print(f"\nFound {len(script_tags)} inline script tags")
@@ -216,7 +312,8 @@ class WebCloner:
         """Save the main HTML file."""
         html_path = self.output_dir / "index.html"
         print(f"\nSaving main HTML to: {html_path}")
-        self._save_file(html_path, soup.prettify().encode('utf-8'))
+        # Serialize as-is: prettify() re-indents everything (altering <pre>/<textarea>)
+        self._save_file(html_path, soup.encode('utf-8'))
 
     def _get_file_path(self, url: str, default_ext: Optional[str] = None) -> Path:
         """
@@ -229,7 +326,7 @@ class WebCloner:
         Returns:
             Path object for the file
         """
-        parsed = urlparse(url)
+        parsed = parse_url(url)
         path = unquote(parsed.path)
         
         # Remove leading slash
@@ -246,11 +343,39 @@ class WebCloner:
         
         file_path = self.output_dir / path
         
-        # Ensure parent directories exist
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure parent directories exist (each directory is created only once)
+        parent = file_path.parent
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
         
         return file_path
 
+    def _save_asset(self, url: str, content: bytes, default_ext: str) -> Tuple[Path, bool]:
+        """
+        Save a linked stylesheet or script, reusing an identical file saved earlier.
+
+        CDNs often serve the same bytes under several URLs (mirrors, cache-busting
+        query strings); the tag for a duplicate simply points at the first copy.
+
+        Args:
+            url: URL the content was downloaded from
+            content: Downloaded content
+            default_ext: Default file extension if the URL has none
+
+        Returns:
+            Tuple of (path of the saved file, whether it was newly written)
+        """
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        existing = self._content_paths.get(digest)
+        if existing is not None:
+            return existing, False
+        
+        file_path = self._get_file_path(url, default_ext)
+        self._save_file(file_path, content)
+        self._content_paths[digest] = file_path
+        return file_path, True
+
     def _save_file(self, file_path: Path, content: bytes) -> None:
         """
         Save content to a file.
@@ -262,13 +387,20 @@ class WebCloner:
         file_path.write_bytes(content)
 
 
-def clone_website(url: str, output_dir: Optional[str] = None) -> bool:
+def clone_website(
+    url: str,
+    output_dir: Optional[str] = None,
+    session: Optional[Any] = None,
+    stop_event: Optional[threading.Event] = None
+) -> bool:
     """
     Clone a website by downloading its HTML, CSS, and JS files.
 
     Args:
         url: The URL of the website to clone
         output_dir: Directory where files will be saved (default: from OUTPUT_DIR env variable)
+        session: Optional requests.Session to reuse pooled connections
+        stop_event: Optional event that cancels the clone when set
 
     Returns:
         bool: True if successful, False otherwise
@@ -277,7 +409,7 @@ def clone_website(url: str, output_dir: Optional[str] = None) -> bool:
         >>> clone_website("https://example.com", "custom_dir")
         >>> clone_website("https://example.com")  # Uses OUTPUT_DIR from .env
     """
-    cloner = WebCloner(url, output_dir)
+    cloner = WebCloner(url, output_dir, session, stop_event)
     return cloner.clone()
 
 
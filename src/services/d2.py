@@ -2,6 +2,7 @@
 Utility function for testing rate limiting by making repeated requests to a URL.
 """
 
+import threading
 import time
 import random
 from typing import Optional, Dict, Any
@@ -13,7 +14,9 @@ def make_requests_until_blocked(
     period: float = 1.0,
     max_attempts: Optional[int] = None,
     randomize_params: bool = True,
-    verbose: bool = True
+    verbose: bool = True,
+    session: Optional[Any] = None,
+    stop_event: Optional[threading.Event] = None
 ) -> Dict[str, Any]:
     """
     Makes random requests to a URL every X seconds until blocked.
@@ -24,6 +27,9 @@ def make_requests_until_blocked(
         max_attempts: Maximum number of attempts before stopping (None = unlimited)
         randomize_params: Whether to add random query parameters to requests
         verbose: Whether to print progress information
+        session: Optional requests.Session to reuse pooled connections (default: a
+            new session for this run)
+        stop_event: Optional event that stops the run when set (e.g. from another thread)
     
     Returns:
         Dictionary containing:
@@ -38,6 +44,11 @@ def make_requests_until_blocked(
     except ImportError:
         raise ImportError("requests library is required. Install it with: pip install requests")
     
+    # Every request goes to the same host, so keep one pooled connection for the
+    # whole run; a caller-provided session is reused and left open
+    owns_session = session is None
+    http = session if session is not None else requests.Session()
+    
     success_count = 0
     total_attempts = 0
     blocked = False
@@ -57,8 +68,21 @@ def make_requests_until_blocked(
         print(f"Period: {period} seconds")
         print("-" * 50)
     
+    # The target URL is fixed, so its query separator is too
+    separator = "&" if "?" in url else "?"
+    
     try:
+        # Deadline for the next request; request latency counts toward the period
+        next_at = time.monotonic()
+        
         while True:
+            # Check for a cooperative stop request
+            if stop_event is not None and stop_event.is_set():
+                if verbose:
+                    print("\n\n⚠️  Interrupted by user")
+                error_message = "Interrupted by user"
+                break
+            
             # Check max attempts limit
             if max_attempts is not None and total_attempts >= max_attempts:
                 if verbose:
@@ -80,12 +104,11 @@ def make_requests_until_blocked(
                     "timestamp": str(time.time()),
                     "rand": str(random.randint(1000, 9999)),
                 }
-                separator = "&" if "?" in url else "?"
                 request_url = f"{url}{separator}{urlencode(params)}"
             
             try:
                 # Make the request
-                response = requests.get(
+                response = http.get(
                     request_url,
                     headers=headers,
                     timeout=10
@@ -98,45 +121,56 @@ def make_requests_until_blocked(
                     blocked = True
                     error_message = f"Blocked with status code {response.status_code}"
                     if verbose:
-                        print(f"\n🚫 Request #{total_attempts}: BLOCKED - Status {response.status_code}")
+                        print(f"\n🚫 Request #{total_attempts}: BLOCKED - Status {response.status_code}", flush=True)
                     break
                 elif response.status_code >= 400:
                     blocked = True
                     error_message = f"Error status code {response.status_code}"
                     if verbose:
-                        print(f"\n❌ Request #{total_attempts}: ERROR - Status {response.status_code}")
+                        print(f"\n❌ Request #{total_attempts}: ERROR - Status {response.status_code}", flush=True)
                     break
                 else:
                     success_count += 1
                     if verbose:
-                        print(f"✓ Request #{total_attempts}: Success (Status {response.status_code})")
+                        print(f"✓ Request #{total_attempts}: Success (Status {response.status_code})", flush=True)
                 
             except requests.exceptions.ConnectionError as e:
                 blocked = True
                 error_message = f"Connection error: {str(e)}"
                 if verbose:
-                    print(f"\n🚫 Request #{total_attempts}: Connection blocked/refused")
+                    print(f"\n🚫 Request #{total_attempts}: Connection blocked/refused", flush=True)
                 break
             except requests.exceptions.Timeout:
                 blocked = True
                 error_message = "Request timeout"
                 if verbose:
-                    print(f"\n⏱️  Request #{total_attempts}: Timeout (possibly blocked)")
+                    print(f"\n⏱️  Request #{total_attempts}: Timeout (possibly blocked)", flush=True)
                 break
             except requests.exceptions.RequestException as e:
                 blocked = True
                 error_message = f"Request exception: {str(e)}"
                 if verbose:
-                    print(f"\n❌ Request #{total_attempts}: Exception - {str(e)}")
+                    print(f"\n❌ Request #{total_attempts}: Exception - {str(e)}", flush=True)
                 break
             
-            # Wait for the specified period before next request
-            time.sleep(period)
+            # Wait out the rest of the period (wakes early on stop); after a
+            # stall longer than the period, resync instead of bursting to catch up
+            next_at += period
+            remaining = next_at - time.monotonic()
+            if remaining <= 0:
+                next_at = time.monotonic()
+            elif stop_event is not None:
+                stop_event.wait(remaining)
+            else:
+                time.sleep(remaining)
             
     except KeyboardInterrupt:
         if verbose:
             print("\n\n⚠️  Interrupted by user")
         error_message = "Interrupted by user"
+    finally:
+        if owns_session:
+            http.close()
     
     # Prepare result summary
     result = {
@@ -1,17 +1,33 @@
 """Utility function for pinging URLs."""
-import time
+from time import perf_counter_ns
 import urllib.request
 import urllib.error
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
-def ping_url(url: str, timeout: int = 10) -> Dict[str, Any]:
+class _ErrorStatusProcessor(urllib.request.HTTPErrorProcessor):
+    """Hand back 4xx/5xx responses as-is instead of raising HTTPError for them."""
+    
+    def http_response(self, request, response):
+        if response.status >= 400:
+            return response  # A status to report, not a failure
+        return super().http_response(request, response)  # Still follows redirects
+    
+    https_response = http_response
+
+
+# Built once; urlopen() would assemble a fresh opener and handler chain per call
+_OPENER = urllib.request.build_opener(_ErrorStatusProcessor)
+
+
+def ping_url(url: str, timeout: int = 10, session: Optional[Any] = None) -> Dict[str, Any]:
     """
     Ping a URL by making an HTTP GET request.
     
     Args:
         url: The URL to ping
         timeout: Request timeout in seconds (default: 10)
+        session: Optional requests.Session to reuse pooled connections
         
     Returns:
         Dictionary with status_code and response_time_ms
@@ -19,7 +35,10 @@ def ping_url(url: str, timeout: int = 10) -> Dict[str, Any]:
     Raises:
         urllib.error.URLError: If the request fails
     """
-    start_time = time.time()
+    if session is not None:
+        return _ping_with_session(session, url, timeout)
+    
+    start_ns = perf_counter_ns()
     
     try:
         req = urllib.request.Request(
@@ -27,9 +46,9 @@ def ping_url(url: str, timeout: int = 10) -> Dict[str, Any]:
             headers={'User-Agent': 'URL-Pinger/1.0'}
         )
         
-        with urllib.request.urlopen(req, timeout=timeout) as response:
+        with _OPENER.open(req, timeout=timeout) as response:
             status_code = response.getcode()
-            response_time_ms = int((time.time() - start_time) * 1000)
+            response_time_ms = (perf_counter_ns() - start_ns) // 1_000_000
             
             return {
                 'status_code': status_code,
@@ -37,8 +56,8 @@ def ping_url(url: str, timeout: int = 10) -> Dict[str, Any]:
             }
             
     except urllib.error.HTTPError as e:
-        # HTTP error (4xx, 5xx), but we got a response
-        response_time_ms = int((time.time() - start_time) * 1000)
+        # Error statuses normally come back as responses; kept for handler errors
+        response_time_ms = (perf_counter_ns() - start_ns) // 1_000_000
         return {
             'status_code': e.code,
             'response_time_ms': response_time_ms
@@ -46,9 +65,82 @@ def ping_url(url: str, timeout: int = 10) -> Dict[str, Any]:
         
     except urllib.error.URLError as e:
         # Connection error, DNS error, etc.
-        response_time_ms = int((time.time() - start_time) * 1000)
         raise Exception(f"Failed to connect to {url}: {str(e.reason)}")
         
     except Exception as e:
         raise Exception(f"Unexpected error pinging {url}: {str(e)}")
 
+
+def _ping_with_session(session: Any, url: str, timeout: int) -> Dict[str, Any]:
+    """Ping a URL through a shared requests.Session."""
+    import requests
+    
+    start_ns = perf_counter_ns()
+    
+    try:
+        response = session.get(
+            url,
+            headers={'User-Agent': 'URL-Pinger/1.0'},
+            timeout=timeout,
+            stream=True  # Only the status line and headers are timed
+        )
+        response_time_ms = (perf_counter_ns() - start_ns) // 1_000_000
+        # Read off the unread body so the keep-alive connection returns to the
+        # session's pool; closing an unread streamed response discards it
+        response.raw.drain_conn()
+        response.close()
+        
+        return {
+            'status_code': response.status_code,
+            'response_time_ms': response_time_ms
+        }
+        
+    except requests.RequestException as e:
+        # Connection error, DNS error, etc.
+        raise Exception(f"Failed to connect to {url}: {str(e)}")
+
+
+def ping_url_pooled(url: str, pool: Any, timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Ping a URL through a shared urllib3 PoolManager.
+    
+    PoolManager is thread-safe, so one instance can serve concurrent pings
+    while reusing TCP/TLS connections to repeated hosts.
+    
+    Args:
+        url: The URL to ping
+        pool: urllib3.PoolManager instance
+        timeout: Request timeout in seconds (default: None, use the pool's own
+            timeout settings)
+        
+    Returns:
+        Dictionary with status_code and response_time_ms
+    """
+    import urllib3
+    
+    start_ns = perf_counter_ns()
+    
+    try:
+        # A per-request timeout would override the pool's, so only pass one if given
+        extra = {} if timeout is None else {'timeout': timeout}
+        response = pool.request(
+            'GET',
+            url,
+            headers={'User-Agent': 'URL-Pinger/1.0'},
+            preload_content=False,  # Only the status line and headers are needed
+            **extra
+        )
+        response_time_ms = (perf_counter_ns() - start_ns) // 1_000_000
+        # Discard the unread body before the keep-alive connection goes back to the
+        # pool; otherwise the next request on it reads leftover body bytes
+        response.drain_conn()
+        response.release_conn()
+        
+        return {
+            'status_code': response.status,
+            'response_time_ms': response_time_ms
+        }
+        
+    except urllib3.exceptions.HTTPError as e:
+        # Connection error, DNS error, etc.
+        raise Exception(f"Failed to connect to {url}: {str(e)}")
@@ -1,19 +1,37 @@
 """Configuration management for penweb application."""
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-# Try to load dotenv
-try:
-    from dotenv import load_dotenv
+
+@lru_cache(maxsize=1)
+def load_env() -> bool:
+    """
+    Load the project .env file once per process.
+    
+    Set PENWEB_SKIP_DOTENV=1 to rely on the system environment only.
+    
+    Returns:
+        bool: True if a .env file was loaded
+    """
+    if os.environ.get("PENWEB_SKIP_DOTENV") == "1":
+        return False
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return False  # dotenv not installed, will use system environment variables
     # Load .env from project root
     project_root = Path(__file__).parent.parent.parent
     env_path = project_root / ".env"
-    load_dotenv(dotenv_path=env_path)
-except ImportError:
-    pass  # dotenv not installed, will use system environment variables
+    return bool(load_dotenv(dotenv_path=env_path))
+
 
+# Load environment variables on import so os.getenv sees .env values
+load_env()
 
+
+@lru_cache(maxsize=1)
 def get_output_dir() -> Path:
     """
     Get the configured output directory from environment variables.
@@ -32,6 +50,7 @@ def get_output_dir() -> Path:
     return path
 
 
+@lru_cache(maxsize=32)
 def get_clone_output_dir(subdirectory: Optional[str] = None) -> Path:
     """
     Get the output directory for cloned websites.
@@ -55,6 +74,3 @@ def ensure_output_dir_exists() -> None:
     output_dir = get_output_dir()
     output_dir.mkdir(parents=True, exist_ok=True)
 
-
-# For backward compatibility and easy imports
-OUTPUT_DIR = get_output_dir()
@@ -0,0 +1,52 @@
+"""Shared HTTP helpers for penweb services."""
+from functools import lru_cache
+from typing import Any
+from urllib.parse import urlparse
+
+# URL schemes accepted by the HTTP tools
+URL_SCHEMES = ('http://', 'https://')
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+# Memoized urlparse: the same target URL is parsed repeatedly within a session
+parse_url = lru_cache(maxsize=256)(urlparse)
+
+
+def create_session(
+    pool_size: int = 64,
+    user_agent: str = DEFAULT_USER_AGENT,
+    retries: int = 2
+) -> Any:
+    """
+    Create a requests.Session with a pooled keep-alive adapter.
+
+    Reusing one session lets consecutive requests to the same host share
+    TCP/TLS connections instead of reconnecting every time. Idempotent
+    requests are retried briefly on connection errors; POSTs never are.
+
+    Args:
+        pool_size: Number of host pools and connections per pool to keep
+        user_agent: Default User-Agent header for the session
+        retries: Retries per idempotent request (0 to disable)
+
+    Returns:
+        Configured requests.Session
+    """
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+    except ImportError:
+        raise ImportError("requests library is required. Install it with: pip install requests")
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retries, backoff_factor=0.2)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['User-Agent'] = user_agent
+    return session
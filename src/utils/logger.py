@@ -1,10 +1,58 @@
 """Centralized logging configuration for the application."""
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# Default log format; its Formatter is shared by every logger using it
+DEFAULT_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_DEFAULT_FORMATTER = logging.Formatter(DEFAULT_LOG_FORMAT)
+
+
+@lru_cache(maxsize=1)
+def _save_logs_enabled() -> bool:
+    """Read SAVE_LOGS once (on first setup, after .env has been loaded)."""
+    return os.getenv('SAVE_LOGS', 'false').lower() == 'true'
+
+
+@lru_cache(maxsize=1)
+def _log_file_path() -> Path:
+    """Create the logs/ directory and pick this process's timestamped log file."""
+    logs_dir = Path('logs')
+    logs_dir.mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+    return logs_dir / f'{timestamp}.log'
+
+
+@lru_cache(maxsize=8)
+def _file_handler(log_format: str) -> logging.Handler:
+    """
+    Get the process-wide file logging handler for a log format.
+    
+    Loggers share one handler (and one open file) instead of each opening
+    its own; filtering by level is left to the loggers. Records are queued
+    and written by a background listener thread, so emitting a log line
+    never waits on disk I/O.
+    """
+    file_handler = logging.FileHandler(_log_file_path(), mode='a', encoding='utf-8')
+    if log_format == DEFAULT_LOG_FORMAT:
+        file_handler.setFormatter(_DEFAULT_FORMATTER)
+    else:
+        file_handler.setFormatter(logging.Formatter(log_format))
+    
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    # Flush queued records and close the file on interpreter exit
+    atexit.register(listener.stop)
+    
+    return logging.handlers.QueueHandler(log_queue)
+
 
 def setup_logging(
     name: Optional[str] = None,
@@ -33,10 +81,11 @@ def setup_logging(
     logger.handlers.clear()
     
     # Default log format
-    if log_format is None:
-        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    
-    formatter = logging.Formatter(log_format)
+    if log_format is None or log_format == DEFAULT_LOG_FORMAT:
+        log_format = DEFAULT_LOG_FORMAT
+        formatter = _DEFAULT_FORMATTER
+    else:
+        formatter = logging.Formatter(log_format)
     
     # Always add console handler
     console_handler = logging.StreamHandler()
@@ -45,24 +94,11 @@ def setup_logging(
     logger.addHandler(console_handler)
     
     # Check if file logging is enabled
-    save_logs = os.getenv('SAVE_LOGS', 'false').lower() == 'true'
-    
-    if save_logs:
-        # Create logs directory if it doesn't exist
-        logs_dir = Path('logs')
-        logs_dir.mkdir(exist_ok=True)
-        
-        # Create timestamped log file
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        log_file = logs_dir / f'{timestamp}.log'
-        
-        # Add file handler
-        file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+    if _save_logs_enabled():
+        # Shared with every other logger writing to this process's log file
+        logger.addHandler(_file_handler(log_format))
         
-        logger.info(f"File logging enabled. Logs will be saved to: {log_file}")
+        logger.info("File logging enabled. Logs will be saved to: %s", _log_file_path())
     else:
         logger.debug("File logging disabled. Set SAVE_LOGS=true to enable.")
     
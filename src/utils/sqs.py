@@ -1,14 +1,60 @@
 """Utility library for AWS Lambda functions handling SQS messages."""
 
-import json
 import logging
 import re
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, TypedDict
 from urllib.parse import urlparse
 
+# orjson is optional; it parses small message bodies noticeably faster
+try:
+    from orjson import loads as _json_loads, JSONDecodeError as _JSONDecodeError
+except ImportError:
+    from json import loads as _json_loads, JSONDecodeError as _JSONDecodeError  # type: ignore[assignment]
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# URL schemes accepted in SQS messages
+_URL_SCHEMES = ('http://', 'https://')
+
+# Scheme plus network location (everything up to the first /, ? or #); one C-level
+# scan instead of a startswith check and a full urlparse per message
+_URL_RE = re.compile(r'https?://([^/?#]*)')
+
+# Characters urlparse removes from a URL before splitting it
+_URL_UNSAFE_RE = re.compile(r'[\t\r\n]')
+
+
+class ValidationResult(TypedDict):
+    """Result of validate_url / validate_action."""
+    valid: bool
+    error: Optional[str]
+
+
+# Error messages for the fixed validation failures
+_URL_EMPTY_ERROR = "URL is empty"
+_URL_SCHEME_ERROR = "URL must start with http:// or https://"
+_URL_DOMAIN_ERROR = "URL must have a valid domain"
+_URL_TLD_ERROR = "URL must have a valid domain with TLD"
+_ACTION_EMPTY_ERROR = "Action is empty"
+
+
+def _invalid(error: str) -> ValidationResult:
+    """Build a failed validation result (a fresh dict, so callers may mutate it)."""
+    return {"valid": False, "error": error}
+
+
+# Stand-in for a missing SQS "attributes" map; never mutated
+_NO_ATTRIBUTES: Dict[str, Any] = {}
+
+# Actions accepted in SQS messages (tuple keeps the order used in error messages)
+_VALID_ACTIONS = ('ping', 'clone', 'ddos', 'attempt_login')
+_VALID_ACTION_SET = frozenset(_VALID_ACTIONS)
+_VALID_ACTIONS_TEXT = ', '.join(_VALID_ACTIONS)
+
+# Characters a JSON document can start with; other bodies go straight to URL validation
+_JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
 
 def parse_sqs_message(message_body: str) -> Dict[str, Any]:
     """
@@ -41,12 +87,17 @@ def parse_sqs_message(message_body: str) -> Dict[str, Any]:
     
     message_body = message_body.strip()
     
+    # Plain URLs (the common case) and other bodies that can never be valid
+    # JSON skip the guaranteed decode failure and its exception
+    if message_body.startswith(_URL_SCHEMES) or message_body[0] not in _JSON_START_CHARS:
+        return _parse_plain_url(message_body)
+    
     # Try to parse as JSON first
     try:
-        body_json = json.loads(message_body)
+        body_json = _json_loads(message_body)
         
-        # Handle JSON format
-        if isinstance(body_json, dict):
+        # Handle JSON format (decoders only produce plain dicts)
+        if type(body_json) is dict:
             url = body_json.get('url', '').strip()
             action = body_json.get('action', 'ping').strip().lower()
             
@@ -60,9 +111,9 @@ def parse_sqs_message(message_body: str) -> Dict[str, Any]:
                     "error": f"Invalid URL in JSON: {url_validation['error']}"
                 }
             
-            # Validate action
-            action_validation = validate_action(action)
-            if not action_validation["valid"]:
+            # Validate action (already normalized; validate_action only builds the error)
+            if action not in _VALID_ACTION_SET:
+                action_validation = validate_action(action)
                 return {
                     "status": 0,
                     "url": url,
@@ -77,8 +128,8 @@ def parse_sqs_message(message_body: str) -> Dict[str, Any]:
                 "error": None
             }
         
-        # Handle JSON array or other types
-        elif isinstance(body_json, (list, str, int, float, bool)):
+        # Handle JSON array or other types (including null)
+        else:
             return {
                 "status": 0,
                 "url": None,
@@ -86,27 +137,9 @@ def parse_sqs_message(message_body: str) -> Dict[str, Any]:
                 "error": f"Invalid JSON format: expected object, got {type(body_json).__name__}"
             }
             
-    except json.JSONDecodeError:
+    except _JSONDecodeError:
         # Not JSON, treat as plain URL string
-        url = message_body.strip()
-        
-        # Validate URL
-        url_validation = validate_url(url)
-        if not url_validation["valid"]:
-            return {
-                "status": 0,
-                "url": None,
-                "action": None,
-                "error": f"Invalid URL format: {url_validation['error']}"
-            }
-        
-        # Default action is 'ping' for plain URLs
-        return {
-            "status": 1,
-            "url": url,
-            "action": "ping",
-            "error": None
-        }
+        return _parse_plain_url(message_body)
     
     except Exception as e:
         return {
@@ -117,7 +150,36 @@ def parse_sqs_message(message_body: str) -> Dict[str, Any]:
         }
 
 
-def validate_url(url: str) -> Dict[str, Union[bool, str]]:
+def _parse_plain_url(url: str) -> Dict[str, Any]:
+    """
+    Build the instruction for a plain (non-JSON) URL message body.
+    
+    Args:
+        url: Stripped message body
+        
+    Returns:
+        Instruction dictionary (see parse_sqs_message); the action defaults to ping
+    """
+    # Validate URL
+    url_validation = validate_url(url)
+    if not url_validation["valid"]:
+        return {
+            "status": 0,
+            "url": None,
+            "action": None,
+            "error": f"Invalid URL format: {url_validation['error']}"
+        }
+    
+    # Default action is 'ping' for plain URLs
+    return {
+        "status": 1,
+        "url": url,
+        "action": "ping",
+        "error": None
+    }
+
+
+def validate_url(url: str) -> ValidationResult:
     """
     Validate URL format.
     
@@ -128,55 +190,42 @@ def validate_url(url: str) -> Dict[str, Union[bool, str]]:
         Dictionary with validation result:
         {
             "valid": bool,
-            "error": str (if invalid)
+            "error": str (if invalid), else None
         }
     """
     if not url:
-        return {
-            "valid": False,
-            "error": "URL is empty"
-        }
+        return _invalid(_URL_EMPTY_ERROR)
     
     url = url.strip()
     
     # Check if URL starts with http:// or https://
-    if not url.startswith(('http://', 'https://')):
-        return {
-            "valid": False,
-            "error": "URL must start with http:// or https://"
-        }
+    match = _URL_RE.match(url)
+    if match is None:
+        return _invalid(_URL_SCHEME_ERROR)
     
-    # Parse URL to validate format
-    try:
-        parsed = urlparse(url)
-        
-        # Check if URL has a valid netloc (domain)
-        if not parsed.netloc:
-            return {
-                "valid": False,
-                "error": "URL must have a valid domain"
-            }
-        
-        # Basic domain validation (at least one dot for TLD)
-        if '.' not in parsed.netloc:
-            return {
-                "valid": False,
-                "error": "URL must have a valid domain with TLD"
-            }
-        
-        return {
-            "valid": True,
-            "error": None
-        }
-        
-    except Exception as e:
-        return {
-            "valid": False,
-            "error": f"Invalid URL format: {str(e)}"
-        }
+    netloc = match.group(1)
+    
+    # Rare inputs take the full urlparse path: bracketed (IPv6) and non-ASCII hosts
+    # need its bracket and NFKC normalization checks, and it drops tab/CR/LF
+    # characters before splitting, which can change the netloc
+    if '[' in netloc or ']' in netloc or not netloc.isascii() or _URL_UNSAFE_RE.search(url):
+        try:
+            netloc = urlparse(url).netloc
+        except ValueError as e:
+            return _invalid(f"Invalid URL format: {str(e)}")
+    
+    # Check if URL has a valid netloc (domain)
+    if not netloc:
+        return _invalid(_URL_DOMAIN_ERROR)
+    
+    # Basic domain validation (at least one dot for TLD)
+    if '.' not in netloc:
+        return _invalid(_URL_TLD_ERROR)
+    
+    return {"valid": True, "error": None}
 
 
-def validate_action(action: str) -> Dict[str, Union[bool, str]]:
+def validate_action(action: str) -> ValidationResult:
     """
     Validate action parameter.
     
@@ -187,28 +236,18 @@ def validate_action(action: str) -> Dict[str, Union[bool, str]]:
         Dictionary with validation result:
         {
             "valid": bool,
-            "error": str (if invalid)
+            "error": str (if invalid), else None
         }
     """
     if not action:
-        return {
-            "valid": False,
-            "error": "Action is empty"
-        }
+        return _invalid(_ACTION_EMPTY_ERROR)
     
     action = action.strip().lower()
-    valid_actions = ['ping', 'clone', 'ddos', 'attempt_login']
     
-    if action not in valid_actions:
-        return {
-            "valid": False,
-            "error": f"Invalid action '{action}'. Must be one of: {', '.join(valid_actions)}"
-        }
+    if action not in _VALID_ACTION_SET:
+        return _invalid(f"Invalid action '{action}'. Must be one of: {_VALID_ACTIONS_TEXT}")
     
-    return {
-        "valid": True,
-        "error": None
-    }
+    return {"valid": True, "error": None}
 
 
 def instruction_parser(message_body: str) -> Dict[str, Any]:
@@ -234,14 +273,14 @@ def instruction_parser(message_body: str) -> Dict[str, Any]:
         
         # Log the result for debugging
         if result["status"] == 1:
-            logger.info(f"Successfully parsed instruction: URL={result['url']}, Action={result['action']}")
+            logger.info("Successfully parsed instruction: URL=%s, Action=%s", result['url'], result['action'])
         else:
-            logger.warning(f"Failed to parse instruction: {result['error']}")
+            logger.warning("Failed to parse instruction: %s", result['error'])
         
         return result
         
     except Exception as e:
-        logger.error(f"Unexpected error in instruction_parser: {str(e)}")
+        logger.error("Unexpected error in instruction_parser: %s", e)
         return {
             "status": 0,
             "url": None,
@@ -270,7 +309,7 @@ def extract_message_metadata(record: Dict[str, Any]) -> Dict[str, Any]:
         "message_id": record.get('messageId', 'unknown'),
         "receipt_handle": record.get('receiptHandle', ''),
         "source": record.get('eventSource', 'unknown'),
-        "timestamp": record.get('attributes', {}).get('SentTimestamp', '')
+        "timestamp": (record.get('attributes') or _NO_ATTRIBUTES).get('SentTimestamp', '')
     }
 
 
@@ -286,12 +325,15 @@ def create_response(status_code: int, message: str, data: Optional[Dict[str, Any
     Returns:
         Standardized response dictionary
     """
-    response = {
+    if not data:
+        return {
+            "statusCode": status_code,
+            "message": message
+        }
+    
+    # Built in one step rather than creating the dict and then update()-ing it
+    return {
         "statusCode": status_code,
-        "message": message
+        "message": message,
+        **data
     }
-    
-    if data:
-        response.update(data)
-    
-    return response
@@ -8,12 +8,12 @@ import sys
 from pathlib import Path
 import importlib.util
 
-# Add the current directory to the path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-# Import lambda handler from lambda.py file
+# Import lambda handler from the single Lambda entrypoint
 # Using importlib to avoid 'lambda' reserved keyword issue
-lambda_file = Path(__file__).parent / "lambda.py"
+lambda_file = Path(__file__).parent.parent / "src" / "lambda" / "entrypoint.py"
 spec = importlib.util.spec_from_file_location("lambda_module", lambda_file)
 lambda_module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(lambda_module)
@@ -102,7 +102,7 @@ def test_invalid_url():
     result = lambda_handler(event, None)
     print(f"Result: {json.dumps(result, indent=2)}")
     assert result['failed'] == 1
-    assert 'Invalid URL format' in result['failed_pings'][0]['error']
+    assert 'Invalid URL format' in result['failed_operations'][0]['error']
     print("✓ Test passed")
 
 
@@ -0,0 +1,128 @@
+"""
+Regression test for pooled pings against a local keep-alive server.
+Run with: python test/ping_pool.py
+"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import importlib.util
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Load the Lambda entrypoint so the test exercises its real connection pool
+lambda_file = Path(__file__).parent.parent / "src" / "lambda" / "entrypoint.py"
+spec = importlib.util.spec_from_file_location("lambda_module", lambda_file)
+lambda_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(lambda_module)
+
+from services.ping import ping_url
+from utils.http import create_session
+
+# Large enough that unread bytes would corrupt the next response on the connection
+BODY = b"x" * 8192
+
+# Client (host, port) pairs seen by the server, one per TCP connection
+client_connections = set()
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Serves a body on every response and keeps connections open."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        client_connections.add(self.client_address)
+        if self.path == "/redirect":
+            self.send_response(301)
+            self.send_header("Location", "/")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass  # Keep test output readable
+
+
+def start_server():
+    """Start the keep-alive server on a free port and return its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def test_repeated_pings_same_host(base_url):
+    """Pings sharing pooled keep-alive connections must all succeed"""
+    print("\n=== Test 1: Repeated Pooled Pings ===")
+
+    for i in range(30):
+        result = lambda_module._do_ping(f"{base_url}/")
+        assert result['success'], f"Ping #{i + 1} failed: {result['error']}"
+        assert result['data']['status_code'] == 200, result
+    print("✓ Test passed")
+
+
+def test_redirect_followed(base_url):
+    """Pooled pings follow redirects like the urllib path"""
+    print("\n=== Test 2: Redirect ===")
+
+    pooled = lambda_module._do_ping(f"{base_url}/redirect")
+    plain = ping_url(f"{base_url}/redirect")
+    print(f"Pooled: {pooled['data']}, urllib: {plain}")
+    assert pooled['data']['status_code'] == 200, pooled
+    assert plain['status_code'] == 200, plain
+    print("✓ Test passed")
+
+
+def test_mixed_pings(base_url):
+    """Redirects and direct pings interleaved on the same connections"""
+    print("\n=== Test 3: Interleaved Pings ===")
+
+    for i in range(30):
+        path = "/redirect" if i % 3 == 0 else "/"
+        result = lambda_module._do_ping(f"{base_url}{path}")
+        assert result['success'], f"Ping #{i + 1} failed: {result['error']}"
+        assert result['data']['status_code'] == 200, result
+    print("✓ Test passed")
+
+
+def test_session_reuses_connection(base_url):
+    """CLI pings through a shared session keep using one pooled connection"""
+    print("\n=== Test 4: Shared Session Keep-Alive ===")
+
+    session = create_session()
+    client_connections.clear()
+    for i in range(10):
+        path = "/redirect" if i % 3 == 0 else "/"
+        result = ping_url(f"{base_url}{path}", session=session)
+        assert result['status_code'] == 200, result
+    print(f"Connections opened: {len(client_connections)}")
+    assert len(client_connections) == 1, client_connections
+    print("✓ Test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("Running Pooled Ping Tests")
+    print("=" * 50)
+
+    if lambda_module.http_pool is None:
+        print("urllib3 is not installed; pooled pings are disabled")
+        sys.exit(1)
+
+    server, base_url = start_server()
+    try:
+        test_repeated_pings_same_host(base_url)
+        test_redirect_followed(base_url)
+        test_mixed_pings(base_url)
+        test_session_reuses_connection(base_url)
+    finally:
+        server.shutdown()
+
+    print("\n" + "=" * 50)
+    print("✓ All tests passed successfully!")
+    print("=" * 50)
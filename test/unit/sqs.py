@@ -3,12 +3,11 @@
 
 import sys
 import os
-sys.path.append(os.path.dirname(__file__))
-
-from lib import instruction_parser, validate_url, validate_action
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 def test_instruction_parser():
     """Test the instruction_parser function with various inputs."""
+    from utils.sqs import instruction_parser
     
     print("=== Testing instruction_parser ===\n")
     
@@ -49,6 +48,7 @@ def test_instruction_parser():
 
 def test_validation_functions():
     """Test the individual validation functions."""
+    from utils.sqs import validate_url, validate_action
     
     print("\n=== Testing validation functions ===\n")
     
@@ -63,6 +63,10 @@ def test_validation_functions():
         "ftp://example.com",
         "https://",
         "https://example",
+        "http://[bad.com",  # Unbalanced IPv6 bracket
+        "http://[a.b]",  # Bracketed host that is not an IP address
+        "http://ex＃ample.com",  # Fullwidth '#' normalizes to a delimiter (NFKC)
+        "http://a℀.com",  # '℀' normalizes to 'a/c' (NFKC)
     ]
     
     for url in url_tests:
@@ -70,6 +74,17 @@ def test_validation_functions():
         status = "✅" if result['valid'] else "❌"
         print(f"  {status} {url}: {result}")
     
+    # Malformed bracketed hosts and hosts that change under NFKC normalization
+    # must be rejected, as urlparse does
+    assert not validate_url("http://[bad.com")['valid']
+    assert not validate_url("http://[a.b]")['valid']
+    for url in ("http://ex＃ample.com", "http://a℀.com", "http://ex／ample.com/x"):
+        result = validate_url(url)
+        assert not result['valid'], url
+        assert "NFKC" in result['error'], result
+    # Tabs and newlines are dropped before the netloc is checked
+    assert validate_url("http://\n/path")['error'] == "URL must have a valid domain"
+    
     print("\nTesting validate_action:")
     action_tests = [
         "ping",